@@ -0,0 +1 @@
+from engine_throughput import *
\ No newline at end of file
@@ -0,0 +1,61 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from model.main import BlockCodec, NullCodec, ZlibCodec, LzmaCodec
+
+CODECS_UNDER_TEST = [NullCodec(), ZlibCodec(1), ZlibCodec(6), LzmaCodec(1)]
+
+GAME_LENGTHS = [10, 50, 200]
+"""
+Turns played before the snapshot is taken and the journal closed
+"""
+
+@dataclass
+class CompressionResult:
+    """
+    Result of one codec on one workload
+
+    Attributes
+    ----------
+    codec : str
+        The codec's name and level
+    workload : str
+        "snapshot" or "journal", with the number of turns
+    raw_bytes : int
+        The size without compression
+    stored_bytes : int
+        The size on disk
+    ratio : float
+        raw_bytes / stored_bytes
+    write_us : float
+        Median microseconds to encode and write
+    read_us : float
+        Median microseconds to read and decode
+    seek_us : float
+        Median microseconds to read the header of a snapshot, or to
+        seek to the middle turn of a journal
+    """
+
+def bench_snapshots(codec: BlockCodec, turns: int, repeats: int = 200) -> CompressionResult:
+    """
+    Times encode_game() and decode_game() for a game after `turns`
+
+    Notes
+    -----
+    The game is played by the baseline policy with a fixed seed, so
+    every codec compresses the same snapshot. Files are written to a
+    temporary directory to include the cost of the write.
+    """
+
+def bench_journals(codec: BlockCodec, turns: int, repeats: int = 20) -> CompressionResult:
+    """
+    Times writing, replaying and seeking a journal of `turns`
+    """
+
+def main() -> None:
+    """
+    Runs every codec on every workload and prints a table of
+    CompressionResult
+    """
+
+if __name__ == "__main__":
+    main()
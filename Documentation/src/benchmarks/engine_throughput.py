@@ -0,0 +1,82 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from model.main import Game, GameMetadata, EngineProfile
+from model.utils import GameMode
+from model.bots import Bot, BASELINE_BOTS
+
+TARGET_GAMES_PER_SECOND = 1000
+"""
+Complete four player games per second per core on the
+traditional map under EngineProfile.headless()
+"""
+
+@dataclass
+class ThroughputResult:
+    """
+    Result of one throughput run
+
+    Attributes
+    ----------
+    games : int
+        The number of games completed
+    seconds : float
+        Wall time taken by the games, excluding setup
+    games_per_second : float
+        games / seconds
+    commands_per_second : float
+        The number of commands executed per second
+    mean_turns : float
+        The mean turns_played of the completed games
+    """
+
+def run_games(games: int,
+            bots: list[type[Bot]] = None,
+            total_players: int = 4,
+            gamemode: GameMode = GameMode.SIMULATION,
+            seed: int = 0
+            ) -> ThroughputResult:
+    """
+    Plays `games` complete games on one core and times them
+
+    Parameters
+    ----------
+    games : int
+        The number of games to play
+    bots : list[type[Bot]]
+        The bot of each seat(None seats the baseline bots of 
+        BASELINE_BOTS in turn)
+    total_players : int
+        The number of players per game
+    gamemode : GameMode
+        SIMULATION or TRAINING to measure the headless profile,
+        LOCAL_PLAY to measure the interactive one
+    seed : int
+        The seed of the first game. Game i uses seed + i
+
+    Returns
+    -------
+    ThroughputResult
+        The measured throughput
+
+    Notes
+    -----
+    Games are created with Game.create_game, automatic placement 
+    and the traditional map, and are played until the state is 
+    EndState. Bot decision time is included, since the baseline 
+    bots are the standard workload. Timing uses time.perf_counter and excludes the 
+    first game, which warms the map topology cache.
+    """
+
+def main() -> None:
+    """
+    Runs the benchmark from the command line
+
+    Notes
+    -----
+    Prints the ThroughputResult for the headless and interactive
+    profiles and exits with status 1 if the headless run is below
+    TARGET_GAMES_PER_SECOND.
+    """
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+from __future__ import annotations
+from model.bots import MCTSConfig
+
+POSITIONS = ["opening", "midgame", "endgame"]
+"""
+Positions searched, taken after a fixed number of turns of a seeded
+baseline game
+"""
+
+def bench_iterations(config: MCTSConfig, position: str, seconds: float = 5.0) -> float:
+    """
+    Returns the iterations per second of one search
+
+    Notes
+    -----
+    Searches from the position for `seconds` of wall time and reads
+    MCTSPlayer.iterations_per_second.
+    """
+
+def main() -> None:
+    """
+    Prints iterations per second for every position with 1 worker
+    and with os.cpu_count() workers
+    """
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+from bot import *
+from baseline import *
+from mcts import *
+from endgame import *
\ No newline at end of file
@@ -0,0 +1,94 @@
+from __future__ import annotations
+from .bot import Bot, GameView
+from ..utils import Command
+
+class RandomLegalBot(Bot):
+    """
+    Plays a uniformly random legal action
+
+    Notes
+    -----
+    Picks an index into LegalActions.actions and the amount uniformly
+    between 1 and its maximum. NEXT_TURN is given the same weight as
+    any other action, so turns stay short.
+    """
+
+    def act(self, view: GameView) -> Command:
+        """
+        Returns a random legal command
+        """
+
+class GreedyContinentBot(Bot):
+    """
+    Concentrates on the continent it is closest to owning
+
+    Notes
+    -----
+    The target continent is the one with the highest share of 
+    territories owned, ties broken by the smallest bonus. Places and
+    recruits on the friendly territory of the target with the most
+    enemy neighbours, attacks into the target while the attacker has
+    more units than the defender, then fortifies towards it.
+    """
+
+    def act(self, view: GameView) -> Command:
+        """
+        Returns the command that grows the target continent
+        """
+
+class BorderReinforcerBot(Bot):
+    """
+    Defensive bot that keeps its borders strong
+
+    Notes
+    -----
+    Recruits on the border territory with the lowest ratio of own 
+    units to adjacent enemy units, only attacks with a ratio above 
+    3, and fortifies by moving units from interior territories (no
+    enemy neighbour) to the weakest border.
+    """
+
+    def act(self, view: GameView) -> Command:
+        """
+        Returns the command that best covers the weakest border
+        """
+
+class OddsAttackerBot(Bot):
+    def __init__(self, seat: int, seed: int = None, threshold: float = 0.6):
+        """
+        Attacks whenever the capture odds are good enough
+
+        Parameters
+        ----------
+        seat : int
+            The player_id the bot plays
+        seed : int
+            Seed of the bot's own random.Random
+        threshold : float
+            The capture probability from BattleOdds.capture above 
+            which an attack is started
+
+        Notes
+        -----
+        Recruits on the territory with the best attack, focuses the 
+        front with the highest capture probability above `threshold`
+        and resolves it with AttackSimulateCommand, moving every unit
+        but one into the captured territory.
+        """
+
+    def act(self, view: GameView) -> Command:
+        """
+        Returns the command of the best attack, or the next phase
+        """
+
+BASELINE_BOTS: dict[str, type[Bot]] = {
+    "random": RandomLegalBot,
+    "greedy_continent": GreedyContinentBot,
+    "border_reinforcer": BorderReinforcerBot,
+    "odds_attacker": OddsAttackerBot,
+}
+"""
+Every baseline bot by name. Each decides in tens of microseconds 
+by scanning the view's arrays once, without building Commands for
+candidate actions
+"""
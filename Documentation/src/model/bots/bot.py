@@ -0,0 +1,120 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from ..main import Game, ActionSpace, LegalActions
+from ..utils import Command
+
+class GameView:
+    def __init__(self, game: Game):
+        """
+        Read-only window on a `Game` for bots
+
+        Parameters
+        ----------
+        game : Game
+            The game being viewed
+
+        Attributes
+        ----------
+        owners : memoryview
+            Read-only view of Board.owners
+        units : memoryview
+            Read-only view of Board.units
+        adjacency_offsets : memoryview
+            Read-only view of Board.adjacency_offsets
+        adjacency : memoryview
+            Read-only view of Board.adjacency
+        continent_of : memoryview
+            Read-only view of Board.continent_of
+        action_space : ActionSpace
+            The action encoding of the map
+
+        Notes
+        -----
+        Views are made once with memoryview(...).toreadonly() and stay
+        valid for the whole game, so building a GameView per decision
+        is not needed. Bots cannot reach `game` through the view;
+        bots that need to try commands use fork().
+        """
+
+    @property
+    def player(self) -> int:
+        """
+        Returns the player_id of the player to act
+        """
+
+    @property
+    def phase(self) -> type:
+        """
+        Returns the class of the current State
+        """
+
+    @property
+    def cards_held(self) -> tuple[int, ...]:
+        """
+        Returns the number of cards held by each player
+        """
+
+    def legal_actions(self) -> LegalActions:
+        """
+        Returns Game.legal_actions()
+        """
+
+    def command(self, action_id: int, amount: int = 1) -> Command:
+        """
+        Returns ActionSpace.decode() of an action for the viewed game
+        """
+
+    def fork(self) -> Game:
+        """
+        Returns Game.fork() of the viewed game
+
+        Notes
+        -----
+        The copy is independent of the viewed game, so a bot can
+        execute and undo commands on it freely. Available to every
+        bot, it is the only way a bot gets a Game.
+        """
+
+class Bot(ABC):
+    def __init__(self, seat: int, seed: int = None):
+        """
+        Abstract class for every computer player
+
+        Parameters
+        ----------
+        seat : int
+            The player_id the bot plays
+        seed : int
+            Seed of the bot's own random.Random(None draws one)
+
+        Attributes
+        ----------
+        seat : int
+            The player_id the bot plays
+        rng : Random
+            The bot's random number generator, separate from the 
+            game's so bots never change the dice
+
+        Notes
+        -----
+        Bots are created from their class and (seat, seed) only, so
+        the class itself can be sent to worker processes.
+        """
+
+    @abstractmethod
+    def act(self, view: GameView) -> Command:
+        """
+        Returns the command to play in the current position
+
+        Notes
+        -----
+        Only called when view.player is `seat`. Must return a legal
+        command.
+        """
+
+    def observe(self, view: GameView, action: int) -> None:
+        """
+        Called after any player's action, for bots that keep state
+        between decisions. Does nothing by default
+        """
+        pass
@@ -0,0 +1,154 @@
+from __future__ import annotations
+from dataclasses import dataclass
+import struct
+from ..main import Game
+from ..utils import BattleOdds
+
+CACHE_RECORD_FORMAT = struct.Struct("<QfiH")
+"""
+position_hash, value for the player to act, best action id, amount
+of the best action
+"""
+
+@dataclass
+class SolveResult:
+    """
+    The exact value of a position
+
+    Attributes
+    ----------
+    value : float
+        The probability that the player to act wins with best play
+    action : int
+        The action id achieving `value`
+    amount : int
+        The amount of `action`
+    nodes : int
+        The number of positions expanded, excluding cache hits
+    """
+
+class SolvedPositionCache:
+    def __init__(self, file_name: str):
+        """
+        Solved positions kept on disk across runs
+
+        Parameters
+        ----------
+        file_name : str
+            The base path of the cache
+
+        Attributes
+        ----------
+        entries : dict[int, tuple[float, int, int]]
+            Value, action and amount by position hash
+        pending : list[bytes]
+            Records solved since the last flush
+
+        Notes
+        -----
+        The cache is file_name, a sorted array of CACHE_RECORD_FORMAT
+        records, plus one append-only file per process 
+        (file_name + ".<pid>") so tournament workers never write to 
+        the same file. load() reads all of them. merge() folds the 
+        per-process files into a new sorted file with 
+        write-then-rename.
+
+        Position hashes depend on the map and rules, so the file 
+        header records both and a mismatching cache is ignored.
+        """
+
+    def load(self) -> None:
+        """
+        Reads the cache and every per-process file into `entries`
+        """
+
+    def flush(self) -> None:
+        """
+        Appends `pending` to this process's file
+        """
+
+    def merge(self) -> None:
+        """
+        Compacts every file of the cache into one sorted file
+        """
+
+class EndgameSolver:
+    def __init__(self,
+                max_territories: int = 12,
+                max_units: int = 40,
+                cache: SolvedPositionCache = None,
+                odds: BattleOdds = None
+                ):
+        """
+        Expectimax solver for two-player endgames
+
+        Parameters
+        ----------
+        max_territories : int
+            Positions with more territories than this are not solved
+        max_units : int
+            Positions with more units in total than this are not 
+            solved
+        cache : SolvedPositionCache
+            Persistent cache shared between runs(None keeps results 
+            in memory only)
+        odds : BattleOdds
+            The battle tables(None uses BattleOdds.shared())
+
+        Attributes
+        ----------
+        memo : dict[int, tuple[float, int, int, int]]
+            Value, action, amount and search depth by position hash 
+            for this run. Proven values are stored with depth -1
+
+        Notes
+        -----
+        Only territories that are owned by either player and are 
+        connected to the front matter, so the size limits are 
+        checked on them. Decision nodes take the maximum over 
+        Game.legal_actions() for the player to act and the minimum
+        for the opponent. Each AttackManualCommand is a chance node 
+        weighted by BattleOdds.round_distribution(). Every outcome 
+        is applied with AttackManualCommand(outcome=...), so dice 
+        are never rolled. solve() works on Game.fork() of the 
+        position and branches it with execute() and undo(), leaving
+        the live game and its subscribers untouched.
+        """
+
+    def solvable(self, game: Game) -> bool:
+        """
+        Returns True if exactly two players remain and the position
+        is within the size limits
+        """
+
+    def solve(self, game: Game, deadline: float = None) -> SolveResult:
+        """
+        Solves the current position
+
+        Parameters
+        ----------
+        game : Game
+            The position
+        deadline : float
+            time.monotonic() value after which the search gives up
+
+        Returns
+        -------
+        SolveResult
+            The exact result(None if the position is not solvable or
+            the deadline passed)
+
+        Notes
+        -----
+        Iterative deepening on the number of turns, looking up 
+        `memo` and the cache before expanding. The deadline is 
+        checked every 1024 expansions.
+
+        A value is proven when every leaf below it is a terminal 
+        position or a proven memo or cache entry. Leaves cut off by
+        the depth limit are scored heuristically, and values that 
+        depend on them are kept in `memo` with their depth and only
+        reused by passes of equal or smaller depth. Only proven 
+        values are written to the cache, and the search ends once 
+        the root is proven, so a cache hit is always exact.
+        """
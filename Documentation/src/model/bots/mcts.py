@@ -0,0 +1,201 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from ..main import Game
+from ..utils import Command, BattleOdds
+from .bot import Bot, GameView
+from .endgame import EndgameSolver
+
+@dataclass(frozen=True)
+class MCTSConfig:
+    """
+    Settings of an MCTS search
+
+    Attributes
+    ----------
+    iterations : int
+        The number of iterations per move(None for no limit)
+    time_budget : float
+        Seconds per move(None for no limit). The search stops at
+        whichever of iterations and time_budget comes first
+    exploration : float
+        The UCT exploration constant
+    rollout_policy : type[Bot]
+        The bot playing every seat in rollouts(None uses 
+        RandomLegalBot)
+    rollout_turns : int
+        Rollouts stop after this many turns and are scored by 
+        territory share
+    endgame_solver : EndgameSolver
+        Replaces rollouts from positions it can solve(None to 
+        always roll out)
+    workers : int
+        The number of parallel rollout processes(1 runs rollouts 
+        in the search thread)
+    virtual_loss : float
+        Added to a node while its rollout is in flight, so parallel
+        rollouts spread over the tree
+    table_size : int
+        The maximum entries of the transposition table
+    """
+    iterations: int = 1000
+    time_budget: float = None
+    exploration: float = 1.4
+    rollout_policy: type[Bot] = None
+    rollout_turns: int = 30
+    endgame_solver: EndgameSolver = None
+    workers: int = 1
+    virtual_loss: float = 1.0
+    table_size: int = 1 << 20
+
+class DecisionNode:
+    def __init__(self, position_hash: int, player: int):
+        """
+        A position where a player chooses an action
+
+        Attributes
+        ----------
+        position_hash : int
+            Game.position_hash of the position
+        player : int
+            The player to act
+        visits : int
+            The number of iterations through the node
+        actions : array[int]
+            The legal action ids, from Game.legal_actions()
+        children : dict[int, DecisionNode | ChanceNode]
+            The child of every expanded action
+        values : dict[int, float]
+            The summed value of every expanded action, from the 
+            point of view of `player`
+        """
+
+class ChanceNode:
+    def __init__(self, action: int, outcomes: list[tuple[int, int, float]]):
+        """
+        The dice roll after AttackManualCommand or AttackSimulateCommand
+
+        Parameters
+        ----------
+        action : int
+            The attack action id
+        outcomes : list[tuple[int, int, float]]
+            (attacker losses, defender losses, probability) of every
+            possible result, from BattleOdds
+
+        Attributes
+        ----------
+        children : dict[tuple[int, int], DecisionNode]
+            The position after each sampled outcome
+
+        Notes
+        -----
+        For AttackManualCommand outcomes come from 
+        BattleOdds.round_distribution(). For AttackSimulateCommand 
+        they come from BattleOdds.battle_distribution() of the 
+        front's stacks, loss threshold and dice. Selection samples 
+        an outcome by its probability instead of using UCT, and the
+        node's value is the probability-weighted mean of its 
+        children.
+
+        The sampled outcome is applied by executing the attack 
+        command with `outcome` set, so the search's game never rolls
+        dice and the child reached always matches the sample.
+        """
+
+class TranspositionTable:
+    def __init__(self, size: int):
+        """
+        Shares DecisionNodes between paths reaching the same position
+
+        Attributes
+        ----------
+        nodes : dict[int, DecisionNode]
+            Nodes by position hash
+        size : int
+            The maximum number of nodes
+
+        Notes
+        -----
+        When full, nodes not visited in the current or previous move
+        are dropped.
+        """
+
+class MCTSPlayer(Bot):
+    def __init__(self, seat: int, seed: int = None, config: MCTSConfig = MCTSConfig()):
+        """
+        Monte Carlo tree search player
+
+        Parameters
+        ----------
+        seat : int
+            The player_id the bot plays
+        seed : int
+            Seed of the bot's own random.Random
+        config : MCTSConfig
+            The search settings
+
+        Attributes
+        ----------
+        root : DecisionNode
+            The root of the current tree
+        table : TranspositionTable
+            Every node of the tree by position hash
+        odds : BattleOdds
+            BattleOdds.shared()
+        iterations_per_second : float
+            Measured over the last search
+
+        Notes
+        -----
+        Each search works on GameView.fork() of the position, taken
+        once per decision. Iterations branch the fork with 
+        Game.execute() and return to the root with Game.undo(), so 
+        the live game is never mutated, journaled or seen by its 
+        subscribers.
+
+        With workers > 1, leaves are sent to a process pool as 
+        encode_game() snapshots and rollout results come back 
+        asynchronously, using virtual loss to keep the search thread
+        selecting other leaves meanwhile.
+        """
+
+    def act(self, view: GameView) -> Command:
+        """
+        Returns choose() of view.fork()
+        """
+
+    def choose(self, game: Game) -> Command:
+        """
+        Searches from the current position and returns the command 
+        of the most visited action
+
+        Parameters
+        ----------
+        game : Game
+            A fork of the position, which the search mutates
+
+        Notes
+        -----
+        Runs until the iteration or time budget is spent. Reuses 
+        `root` if its position_hash matches the game, else looks the
+        position up in `table` before starting a new tree.
+        """
+
+    def observe(self, view: GameView, action: int) -> None:
+        """
+        Moves `root` down the tree after any player's action
+
+        Parameters
+        ----------
+        view : GameView
+            The game after the action
+        action : int
+            The action id that was played
+
+        Notes
+        -----
+        Keeps the subtree of `action`, or of the dice outcome that 
+        happened for attacks, so statistics carry over between moves
+        and turns. Everything else becomes unreachable and is 
+        dropped from `table` lazily.
+        """
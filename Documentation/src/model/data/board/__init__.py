@@ -1,3 +1,4 @@
 from antiquity_data import *
 from board import *
-from traditional_data import *
\ No newline at end of file
+from traditional_data import *
+from threat import *
\ No newline at end of file
@@ -2,6 +2,7 @@ from __future__ import annotations
 from enum import Enum
 from ....utils.game_enums import *
 from typing import Self
+from array import array
 
 class Player:
     pass
@@ -25,6 +26,27 @@ class Board:
         ----------
         continents : list[Continent]
             All continents in the game. 
+        territories : list[Territory]
+            Every territory, indexed by territory_id
+        owners : array[int]
+            The player_id owning each territory(-1 if unowned)
+        units : array[int]
+            The number of units on each territory
+        continent_of : array[int]
+            The index of the continent of each territory
+        adjacency_offsets : array[int]
+            Start of each territory's neighbours in `adjacency`
+            (length is the number of territories + 1)
+        adjacency : array[int]
+            The territory_ids of every territory's neighbours,
+            concatenated
+        dirty : set[int]
+            The territory_ids whose owner or units changed since
+            the last clear_dirty()
+        zobrist : int
+            64-bit Zobrist hash of owners and units, updated by
+            set_units(), set_owner() and transfer_units() with two
+            XORs per change
 
         Notes
         -----
@@ -36,6 +58,15 @@ class Board:
         Note that it should create itself from startup
         using the data from antiquity_map.py, 
         traditional_map.py if necessary. 
+
+        The compact representation (owners, units, continent_of,
+        adjacency) uses array.array and is always maintained, in
+        every game mode, so saves, GameView, ThreatMap and 
+        SaveChain can read it. compact_board only decides whether 
+        the Territory objects are kept in sync as well: without it,
+        every change is written to both. Territory ids follow the 
+        order of the map file. The topology arrays are built once 
+        per map and shared between boards.
         """
         pass
     
@@ -130,8 +161,96 @@ class Board:
         Subtract units from territory_from and add to territory_to
         To call this in the first place. count must already be of a 
         valid number. 
+
+        Adds both territory ids to `dirty`.
         """ 
 
+    def set_units(self, territory_id: int, units: int) -> None:
+        """
+        Sets the units of a territory and marks it dirty
+
+        Notes
+        -----
+        Every placement, recruitment and battle loss goes through
+        here or transfer_units(), so `dirty` never misses a change.
+        """
+
+    def set_owner(self, territory_id: int, player_id: int) -> None:
+        """
+        Sets the owner of a territory and marks it dirty
+
+        Notes
+        -----
+        Used for claims in placement and captures in attack.
+        """
+
+    def zobrist_key(self, territory_id: int, player_id: int, units: int) -> int:
+        """
+        Returns the random 64-bit key of a territory holding `units`
+        of `player_id`
+
+        Notes
+        -----
+        The key is the table entry of (territory_id, player_id) 
+        XOR splitmix64(unit_seed[territory_id] + units), so every
+        unit count has its own key without bounding the table. The
+        table and seeds are derived from the map, so equal positions
+        hash equally across processes.
+        """
+
+    def clear_dirty(self) -> set[int]:
+        """
+        Returns `dirty` and replaces it with an empty set
+        """
+
+    def get_territory_from_id(self, territory_id: int) -> Territory:
+        """
+        Lookup the territory with the specified id
+
+        Parameters
+        ----------
+        territory_id : int
+            The index of the territory in `territories`
+
+        Returns
+        -------
+        Territory
+            The territory object associated with the id
+        """
+
+    def neighbours(self, territory_id: int) -> array[int]:
+        """
+        Returns the ids of the territories connected to `territory_id`
+
+        Notes
+        -----
+        A slice of `adjacency` between two consecutive
+        `adjacency_offsets`. No Territory objects are touched.
+        """
+
+    def friendly_components(self, player_id: int) -> array[int]:
+        """
+        Labels the connected groups of a player's territories
+
+        Parameters
+        ----------
+        player_id : int
+            The player whose territories are labelled
+
+        Returns
+        -------
+        array[int]
+            For each territory, the label of its group(-1 if not 
+            owned by the player). Two territories are connected 
+            through friendly territories iff their labels match
+
+        Notes
+        -----
+        One union-find pass over `adjacency`. Lets is_adjacent() and
+        the fortify move generator answer in O(1) per pair instead 
+        of one depth first search per pair.
+        """
+
     def get_continent_from_name(self, name: ContinentName) -> Continent:
         """
         Lookup any continent with the specified name
@@ -297,6 +416,7 @@ class Continent:
 class Territory:
     def __init__(self, 
                 name: TerritoryName, 
+                territory_id: int,
                 owner: Player = None, 
                 units: int = 0,
                 connected_territories: list[Territory] = [], 
@@ -308,6 +428,8 @@ class Territory:
         ----------
         name : TerritoryName
             The name of the territory
+        territory_id : int
+            The index of the territory in Board's arrays
         owner : Player
             The player which controls the territory
         units : int
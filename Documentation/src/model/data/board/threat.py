@@ -0,0 +1,110 @@
+from __future__ import annotations
+import numpy as np
+from ....utils import BattleOdds, Event
+
+class Board:
+    pass
+
+class Game:
+    pass
+
+class ThreatMap:
+    def __init__(self, board: Board, hops: int = 2, odds: BattleOdds = None):
+        """
+        Per-territory enemy pressure over the whole board
+
+        Parameters
+        ----------
+        board : Board
+            The board being analysed
+        hops : int
+            How far enemy units can come from
+        odds : BattleOdds
+            The battle tables(None uses BattleOdds.shared())
+
+        Attributes
+        ----------
+        reach : np.ndarray
+            (territories, territories) bool. reach[s, t] is True if
+            t is within `hops` of s. (I + A) ** hops > 0 for the 
+            adjacency matrix A, built once per map and hops
+        adjacent : np.ndarray
+            (territories, territories) bool adjacency matrix
+        threat : np.ndarray
+            (territories,) float32, the enemy units, beyond the one
+            each must leave behind, that can reach each territory
+        strongest : np.ndarray
+            (territories,) int16, the largest adjacent enemy stack
+        attack_odds : np.ndarray
+            (territories,) float32, the probability that `strongest`
+            captures the territory, from BattleOdds.capture
+        key : tuple[int, int]
+            GameStats.turns_played and the player_id of the current
+            player the map was computed for(None if never)
+
+        Notes
+        -----
+        Ownership and units are read as np.frombuffer views of the 
+        board arrays, so no copy is made before computing.
+        """
+
+    def compute(self) -> None:
+        """
+        Computes every territory in one vectorised pass
+
+        Notes
+        -----
+        With U the (territories, players) matrix of units - 1 per
+        owner, reach.T @ U gives the units of each player that can 
+        reach each territory. threat is the row sum minus the column
+        of the territory's owner. strongest is the column maximum of
+        adjacent & (owners differ) weighted by units, and attack_odds
+        indexes BattleOdds.capture with strongest and units.
+        """
+
+    def get(self, game: Game) -> ThreatMap:
+        """
+        Returns the map for the current turn
+
+        Notes
+        -----
+        Calls compute() only if `key` differs from the game's 
+        (turns_played, current player). turns_played only counts
+        rounds, so the current player is part of the key. Within a
+        player's turn, on_change keeps the map current.
+        """
+
+    def attach(self, game: Game) -> None:
+        """
+        Subscribes on_change to every event that changes owners or
+        units
+
+        Notes
+        -----
+        PlaceUnitEvent, RecruitUnitEvent, AttackManualEvent, 
+        AttackSimulateEvent, FortifyCapturedTerritoryEvent and 
+        FortifyTerritoryEvent. Battles change units even when they 
+        do not capture, and placements after a trade happen in the
+        attack phase, so all of them are needed to keep the map 
+        current within a turn.
+        """
+
+    def on_change(self, event: Event) -> None:
+        """
+        Updates the territories affected by a placement, battle or
+        fortification
+
+        Parameters
+        ----------
+        event : Event
+            The event naming the changed territories. Failed events
+            are ignored
+
+        Notes
+        -----
+        Only territories with reach[s] True for a changed territory s
+        can see a different threat, so only those rows are 
+        recomputed, using the same formulas on a row subset.
+        strongest and attack_odds are recomputed for the changed 
+        territories and their neighbours.
+        """
@@ -1,4 +1,4 @@
-from ...utils import Command, ExplicitEvent
+from ...utils import Command, ExplicitEvent, SaveMode
 from dataclasses import dataclass
 from __future__ import annotations
 
@@ -18,10 +18,12 @@ class FailedCommandEvent(ExplicitEvent):
     ----------
     error : str
         The accompanying error message
+    command : Command
+        The command that was rejected
     """
 
 class SaveCommand(Command):
-    def __init__(self, filename: str):
+    def __init__(self, filename: str, mode: SaveMode = SaveMode.FULL):
         """
         A command to save the game to /saves
 
@@ -29,15 +31,23 @@ class SaveCommand(Command):
         ----------
         filename : str
             The name of the file being saved.
+        mode : SaveMode
+            FULL for a snapshot, DELTA to extend the save's SaveChain
 
         Attributes
         ----------
         filename : str
             The name of the file being saved.
+        mode : SaveMode
+            FULL for a snapshot, DELTA to extend the save's SaveChain
         
         Notes
         -----
-        Should overwrite the file if present
+        Should overwrite the file if present. The file uses the 
+        binary format defined in main/save_format.py.
+
+        Once the file is written, the save's entry is updated in
+        SaveCatalogue.shared().
         """
 
     def _validate(self):
@@ -75,6 +85,11 @@ class SaveEvent(ExplicitEvent):
         The accompanying error message from _validate()
     filename : str
         The name of the file that was just saved
+
+    Notes
+    -----
+    Also emitted by AutosaveService once a background save 
+    finishes or fails.
     """
 
 class LoadCommand(Command):
@@ -104,6 +119,9 @@ class LoadCommand(Command):
         Notes
         -----
         Always valid to call. 
+
+        If `filename` has a manifest in /saves it is loaded with 
+        SaveChain.load(), else as a single snapshot.
         """
     
     def execute(self):
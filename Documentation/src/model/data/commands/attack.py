@@ -177,9 +177,22 @@ class CancelFocusOffensiveEvent(ExplicitEvent):
     """
 
 class AttackManualCommand(AttackCommand):
-    def __init__(self):
+    def __init__(self, outcome: tuple[int, int] = None):
         """
         A command to simulate one round of combat in front
+
+        Attributes
+        ----------
+        outcome : tuple[int, int]
+            (attacker losses, defender losses) to apply instead of
+            rolling the dice(None rolls them)
+
+        Notes
+        -----
+        `outcome` lets search bots follow a chosen branch of a 
+        ChanceNode. It must be a non-zero entry of 
+        BattleOdds.round_distribution() for the front's dice, and
+        the game's RNG is not touched when it is given.
         """
     
     def _validate(self, game: Game) -> str:
@@ -225,6 +238,11 @@ class AttackManualCommand(AttackCommand):
         -----
         Modifies State's front by interacting with the interface, overwriting 
         if necessary.
+
+        If `outcome` is set, the losses are applied directly, 
+        attacker_dice_rolled and defender_dice_rolled are left empty
+        and the outcome is recorded in the CommandDelta's 
+        battle_outcome.
         """
         pass
 
@@ -259,11 +277,24 @@ class AttackManualEvent(ExplicitEvent):
     pass
 
 class AttackSimulateCommand(AttackCommand):
-    def __init__(self):
+    def __init__(self, outcome: tuple[int, int] = None):
         """
         A command to simulate battle in the front 
         until the attack is successful, repelled
         or meets the loss threshold 
+
+        Attributes
+        ----------
+        outcome : tuple[int, int]
+            (attacker losses, defender losses) of the whole battle
+            to apply instead of rolling the dice(None rolls them)
+
+        Notes
+        -----
+        `outcome` must be a non-zero entry of 
+        BattleOdds.battle_distribution() for the front's stacks, 
+        loss threshold and dice. The game's RNG is not touched when it is 
+        given.
         """
     
     def _validate(self, game: Game) -> str:
@@ -316,6 +347,9 @@ class AttackSimulateCommand(AttackCommand):
         Should calculate the winner of the battle immediately,
         not create a list of arrays. Could be changed in the 
         future. 
+
+        If `outcome` is set, the losses are applied directly and 
+        recorded in the CommandDelta's battle_outcome.
         """
         pass
 
@@ -5,12 +5,67 @@ from __future__ import annotations
 class Game:
     pass
 
+class Territory:
+    pass
+
 class RecruitmentCommand(Command):
     """
     The family of classes only allowed to execute during the Recruitment phase.
     """
     pass
 
+class RecruitUnitCommand(RecruitmentCommand):
+    def __init__(self, territory_placed_on: Territory, count: int):
+        """
+        A command to recruit units onto a territory
+
+        Attributes
+        ----------
+        territory_placed_on : Territory
+            The territory being recruited on
+        count : int
+            The number of units being recruited
+        """
+        pass
+
+    def _validate(self, game: Game) -> str:
+        """
+        Checks if it is legal to recruit
+        the units on the territory
+
+        Parameters
+        ----------
+        game : Game
+            The instance of game being executed on
+
+        Returns
+        -------
+        str
+            The accompanying error message(None assumes valid)
+
+        Notes
+        -----
+        RecruitUnitCommand should validate if:
+
+        territory_placed_on is owned by the current turn player
+
+            AND
+
+        `count` is greater than zero and no greater than the
+        state's `units_left`
+        """
+
+    def execute(self, game: Game) -> RecruitUnitEvent:
+        """
+        Places the recruited units on the territory
+        if the units and territory are valid
+
+        Returns
+        -------
+        RecruitUnitEvent
+            Data representing the changes made to `Game` by RecruitUnitCommand
+        """
+
 @dataclass
 class RecruitUnitEvent(ExplicitEvent):
     """
@@ -19,6 +19,12 @@ class Deck(Stack):
             The list of cards in the game
         number_of_wildcards : int
             The number of wildcards present(default = 2)
+        holders : array[int]
+            The holder of each card by card index, a player_id or -1
+            for the deck
+        card_zobrist : int
+            64-bit XOR of card_key() of every card and its holder, 
+            updated by move_card()
         """
     
     @property 
@@ -27,6 +33,36 @@ class Deck(Stack):
         Returns if the deck is empty
         """
         
+    def move_card(self, card_index: int, holder: int) -> None:
+        """
+        Records a new holder for a card
+
+        Parameters
+        ----------
+        card_index : int
+            The index of the card
+        holder : int
+            The new holder, a player_id or -1 for the deck
+
+        Notes
+        -----
+        XORs card_key() of the old holder out of card_zobrist and 
+        the new one in. Every draw, trade-in and card transfer on 
+        elimination goes through here, and appends (card_index, old
+        holder, new holder) to the running command's delta when the
+        game records undo history.
+        """
+
+    def card_key(self, card_index: int, holder: int) -> int:
+        """
+        Returns the random 64-bit key of a card held by `holder`
+
+        Notes
+        -----
+        splitmix64 of card_index * 8 + holder + 1, so equal card 
+        positions hash equally across processes.
+        """
+
     def populate_deck(self) -> None:
         """
         Adds every card in the game back to the deck
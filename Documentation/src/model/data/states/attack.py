@@ -1,13 +1,18 @@
-from ...utils.templates import State, Command, ImplicitEvent, ExplicitEvent
+from ...utils.templates import State, Command, CommandRoute, ImplicitEvent, ExplicitEvent
 from ...main.game import Game
 from __future__ import annotations
 from enum import Enum
-from utils.game_enums import BattleStatus
+from utils.game_enums import BattleStatus, AttackSubState
 from dataclasses import dataclass
+from ..commands import *
+from ...main.actions import LegalActions
 
 class Territory:
     pass
 
+class Board:
+    pass
+
 class AttackState(State):
     def __init__(self, game: Game):
         """
@@ -67,6 +72,188 @@ class AttackState(State):
         """
         pass
 
+    @classmethod
+    def _build_dispatch_table(cls) -> dict[type[Command], CommandRoute]:
+        """
+        Returns the routes of every command accepted in the attack phase
+
+        Notes
+        -----
+        Extends the Save and Load routes of State with:
+
+        TradeSetCommand : _validate_trade_set, _on_trade_set
+        PlaceUnitCommand : _validate_place_unit, _on_place_unit
+        FocusOffensiveCommand : _validate_focus, _on_focus
+        CancelFocusOffensiveCommand : _validate_front, _on_cancel_focus
+        AttackManualCommand : _validate_front, _on_battle
+        AttackSimulateCommand : _validate_front, _on_battle
+        AttackChangeAttackerDiceCommand : _validate_front, _on_dice_changed
+        ChangeDefenderDiceCommand : _validate_front, _on_dice_changed
+        ChangeLossThresholdCommand : _validate_front, _on_threshold_changed
+        FortifyCapturedTerritoryCommand : _validate_transfer, _on_transfer
+        NextTurnCommand : _validate_next_turn, _on_next_turn
+
+        AttackManualCommand and AttackSimulateCommand share a handler,
+        which checks the front's status for just_captured and repelled.
+        """
+        table = super()._build_dispatch_table()
+        table[TradeSetCommand] = CommandRoute(cls._validate_trade_set, cls._on_trade_set)
+        table[PlaceUnitCommand] = CommandRoute(cls._validate_place_unit, cls._on_place_unit)
+        table[FocusOffensiveCommand] = CommandRoute(cls._validate_focus, cls._on_focus)
+        table[CancelFocusOffensiveCommand] = CommandRoute(cls._validate_front, cls._on_cancel_focus)
+        table[AttackManualCommand] = CommandRoute(cls._validate_front, cls._on_battle)
+        table[AttackSimulateCommand] = CommandRoute(cls._validate_front, cls._on_battle)
+        table[AttackChangeAttackerDiceCommand] = CommandRoute(cls._validate_front, cls._on_dice_changed)
+        table[ChangeDefenderDiceCommand] = CommandRoute(cls._validate_front, cls._on_dice_changed)
+        table[ChangeLossThresholdCommand] = CommandRoute(cls._validate_front, cls._on_threshold_changed)
+        table[FortifyCapturedTerritoryCommand] = CommandRoute(cls._validate_transfer, cls._on_transfer)
+        table[NextTurnCommand] = CommandRoute(cls._validate_next_turn, cls._on_next_turn)
+        return table
+
+    @classmethod
+    def _build_sub_state_whitelists(cls) -> dict[AttackSubState, frozenset[type[Command]]]:
+        """
+        Returns the commands allowed while a transfer, trade or 
+        placement is pending
+
+        Notes
+        -----
+        EXPECTING_TRANSFER : FortifyCapturedTerritoryCommand
+        EXPECTING_TRADE : TradeSetCommand
+        EXPECTING_PLACEMENT : PlaceUnitCommand
+
+        FREE is not in the map, so every command in the dispatch 
+        table is allowed.
+        """
+        return {
+            AttackSubState.EXPECTING_TRANSFER: frozenset({FortifyCapturedTerritoryCommand}),
+            AttackSubState.EXPECTING_TRADE: frozenset({TradeSetCommand}),
+            AttackSubState.EXPECTING_PLACEMENT: frozenset({PlaceUnitCommand}),
+        }
+
+    @property
+    def sub_state(self) -> AttackSubState:
+        """
+        Returns the current sub-state
+
+        Notes
+        -----
+        Checked in priority order: EXPECTING_TRANSFER if front's
+        status is expecting_transfer, EXPECTING_TRADE if 
+        expecting_trade, EXPECTING_PLACEMENT if unplaced_units > 0,
+        else FREE.
+        """
+
+    def _validate_trade_set(self, command: TradeSetCommand) -> str:
+        """
+        Checks that the player holds the cards of the set(None
+        assumes valid)
+        """
+
+    def _on_trade_set(self, result: TradeSetEvent) -> None:
+        """
+        Adds the units received to unplaced_units and clears 
+        expecting_trade once the player holds fewer than five cards
+        """
+
+    def _validate_place_unit(self, command: PlaceUnitCommand) -> str:
+        """
+        Checks that the count does not exceed unplaced_units(None 
+        assumes valid)
+        """
+
+    def _on_place_unit(self, result: PlaceUnitEvent) -> None:
+        """
+        Subtracts the units placed from unplaced_units
+        """
+
+    def _validate_focus(self, command: FocusOffensiveCommand) -> str:
+        """
+        Validator of FocusOffensiveCommand(None assumes valid)
+
+        Notes
+        -----
+        Focusing is allowed whether or not a front is set, since a
+        new focus replaces the front. The edge itself is checked by
+        FocusOffensiveCommand._validate().
+        """
+
+    def _on_focus(self, result: FocusOffensiveEvent) -> None:
+        """
+        Sets front to a new OffensiveFront, replacing any front 
+        already set, and emits IsActiveFrontEvent
+        """
+
+    def _validate_front(self, command: AttackCommand) -> str:
+        """
+        Checks that a front is focused on(None assumes valid)
+        """
+
+    def _on_cancel_focus(self, result: CancelFocusOffensiveEvent) -> None:
+        """
+        Sets front to None
+        """
+
+    def _on_battle(self, result: AttackManualEvent) -> None:
+        """
+        Checks the front's status after a manual or simulated battle
+
+        Notes
+        -----
+        Sets front to None if repelled. If just_captured, sets 
+        has_captured_territory and handles the elimination of the 
+        defender, card transfer and expecting_trade as described in 
+        _on_execute().
+        """
+
+    def _on_dice_changed(self, result: ChangeAttackerDiceEvent) -> None:
+        """
+        Emits AttackAutoChangeDice if either side can no longer 
+        sustain its dice
+        """
+
+    def _on_threshold_changed(self, result: ChangeLossThresholdEvent) -> None:
+        """
+        Stores the new loss threshold on front
+        """
+
+    def _validate_transfer(self, command: FortifyCapturedTerritoryCommand) -> str:
+        """
+        Checks that the front's status is expecting_transfer(None
+        assumes valid)
+        """
+
+    def _on_transfer(self, result: FortifyCapturedTerritoryEvent) -> None:
+        """
+        Sets front to None once the captured territory is fortified
+        """
+
+    def _validate_next_turn(self, command: NextTurnCommand) -> str:
+        """
+        Checks that no transfer, trade or placement is 
+        pending(None assumes valid)
+        """
+
+    def _on_next_turn(self, result: NextTurnEvent) -> None:
+        """
+        Calls on_exit() before the move to the fortify phase
+        """
+
+    def reset(self) -> None:
+        """
+        Restores the ephemeral data of AttackState for a new turn
+
+        Notes
+        -----
+        Sets current_player to the front of the player queue, 
+        front to None, expecting_trade and has_captured_territory 
+        to False and unplaced_units to zero.
+
+        The OffensiveFront of the previous turn is dropped rather 
+        than mutated, since events emitted during that turn may 
+        still reference it.
+        """
+
     def on_enter(self):
         """
         Called directly after initialisation of AttackState
@@ -96,7 +283,50 @@ class AttackState(State):
         """
         pass
 
-    def _validate(self, command: Command) -> str:
+    def legal_actions(self) -> LegalActions:
+        """
+        Enumerates every legal action of current_player
+
+        Notes
+        -----
+        In EXPECTING_TRANSFER: TRANSFER only, with the attacking 
+        territory's units minus one as the amount.
+
+        In EXPECTING_TRADE: TRADE_SET for every valid set.
+
+        In EXPECTING_PLACEMENT: PLACE for every friendly territory.
+
+        In FREE: FOCUS for every edge from a friendly territory with 
+        more than one unit to an enemy territory, found by scanning 
+        Board.adjacency once, whether or not a front is set, since
+        focusing replaces the front. If a front is set, also 
+        ATTACK_MANUAL, ATTACK_SIMULATE, CANCEL_FOCUS and the 
+        ATTACKER_DICE and DEFENDER_DICE counts the front's units 
+        allow. NEXT_TURN is always legal in FREE.
+        """
+
+    def pack(self) -> bytes:
+        """
+        Serialises the ephemeral data of the phase
+
+        Notes
+        -----
+        current_player uint8, expecting_trade uint8, 
+        has_captured_territory uint8, unplaced_units uint16, then
+        a has_front uint8 followed by OffensiveFront.pack() if set.
+        """
+
+    def unpack(self, data: bytes) -> None:
+        """
+        Restores the ephemeral data of the phase from pack()
+
+        Notes
+        -----
+        front is rebuilt with OffensiveFront.unpack(data, board) 
+        when has_front is set, else set to None.
+        """
+
+    def _validate(self, command: Command, route: CommandRoute = None) -> str:
         """
         Method that ensures command is of the correct class
 
@@ -104,6 +334,8 @@ class AttackState(State):
         ----------
         command : Command
             The command being validated
+        route : CommandRoute
+            The route resolved by execute()(None resolves it)
         
         Returns
         -------
@@ -112,7 +344,8 @@ class AttackState(State):
 
         Notes
         -----
-        If front is not None then
+        Routed through `dispatch_table` and the whitelist of the 
+        current `sub_state`:
         
         if status is expecting_transfer, only allow attack commands of 
         instance FortifyCapturedTerritoryCommand.
@@ -130,7 +363,22 @@ class AttackState(State):
         FortifyCapturedTerritory, NextTurn
 
         """
+        return super()._validate(command, route)
     
+    def _must_transition(self, result: ExplicitEvent) -> bool:
+        """
+        Returns True if `result` needs _on_execute() immediately
+        during execute_many()
+
+        Notes
+        -----
+        Immediate for AttackManualEvent and AttackSimulateEvent 
+        that capture a territory or eliminate a player, and for 
+        NextTurnEvent, since they change the sub-state or may end 
+        the game. The check for remaining attacks is deferred for 
+        every other result.
+        """
+
     def _on_execute(self, result: ExplicitEvent) -> None:
         """
         Checks for side effects and emits events after a command is executed
@@ -143,6 +391,10 @@ class AttackState(State):
 
         Notes
         -----
+        The command specific checks below run in the handler from
+        `dispatch_table`. `_on_execute` itself only checks for
+        available attacks and the transition to the next phase.
+
         If front is not None then
 
         If status is repelled or cancelled, set front to None
@@ -259,7 +511,20 @@ class OffensiveFront:
     Dice and battle simulation commands can only be issued if OffensiveFront
     is not None.        
     """
-    pass
+
+    def pack(self) -> bytes:
+        """
+        Returns the front as territory_from uint8, territory_to uint8,
+        attacker_dice uint8, defender_dice uint8, loss_threshold 
+        uint16 and status uint8
+        """
+
+    @classmethod
+    def unpack(cls, data: bytes, board: Board) -> OffensiveFront:
+        """
+        Rebuilds a front from pack(), resolving territory ids 
+        through `board`
+        """
 
 @dataclass
 class AttackPhaseStartedEvent(ImplicitEvent):
@@ -1,9 +1,10 @@
-from ...utils.templates import State, Command, ImplicitEvent, ExplicitEvent
+from ...utils.templates import State, Command, CommandRoute, ImplicitEvent, ExplicitEvent
 from ...main.game import Game
 from __future__ import annotations
 from enum import Enum
 from utils.game_enums import BattleStatus
 from dataclasses import dataclass
+from ..commands import *
 
 class EndState(State):
     def __init__(self, game: Game):
@@ -41,7 +42,47 @@ class EndState(State):
             When called
         """
     
-    def _validate(self, command: Command) -> str:
+    @classmethod
+    def _build_dispatch_table(cls) -> dict[type[Command], CommandRoute]:
+        """
+        Returns the routes of every command accepted in the end phase
+
+        Notes
+        -----
+        Extends the Save and Load routes of State with:
+
+        CyclePlayerCommand : _validate_cycle, _on_cycle
+        """
+        table = super()._build_dispatch_table()
+        table[CyclePlayerCommand] = CommandRoute(cls._validate_cycle, cls._on_cycle)
+        return table
+
+    def _validate_cycle(self, command: CyclePlayerCommand) -> str:
+        """
+        Always valid in the end phase
+        """
+
+    def _on_cycle(self, result: CyclePlayerEvent) -> None:
+        """
+        Moves current_player to the next player whose stats
+        are displayed
+        """
+
+    def pack(self) -> bytes:
+        """
+        Serialises the ephemeral data of the phase
+
+        Notes
+        -----
+        current_player uint8.
+        """
+
+    def unpack(self, data: bytes) -> None:
+        """
+        Restores current_player from pack()
+        """
+
+    def _validate(self, command: Command, route: CommandRoute = None) -> str:
         """
         Method that ensures command is of the correct subclass
 
@@ -49,6 +90,8 @@ class EndState(State):
         ----------
         command : Command
             The command being validated
+        route : CommandRoute
+            The route resolved by execute()(None resolves it)
         
         Returns
         -------
@@ -60,6 +103,7 @@ class EndState(State):
         The commands that should be accepted are: Save, Load, 
         CyclePlayer
         """
+        return super()._validate(command, route)
     
     def _on_execute(self, result: ExplicitEvent) -> None:
         """
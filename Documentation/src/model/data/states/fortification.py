@@ -1,7 +1,9 @@
-from ...utils.templates import State, Command, ImplicitEvent, ExplicitEvent
+from ...utils.templates import State, Command, CommandRoute, ImplicitEvent, ExplicitEvent
 from ...main.game import Game
 from __future__ import annotations
 from dataclasses import dataclass
+from ..commands import *
+from ...main.actions import LegalActions
 
 class Territory():#dummy for typing
     pass
@@ -38,6 +40,15 @@ class FortificationState(State):
         """
         pass
 
+    def reset(self) -> None:
+        """
+        Restores the ephemeral data of FortificationState for a new turn
+
+        Notes
+        -----
+        Sets current_player to the front of the player queue.
+        """
+
     def on_enter(self):
         """
         Called dirctly after initialisation of FortificationState
@@ -61,7 +72,73 @@ class FortificationState(State):
         Andrew, you may now fortify any territory.
         """
     
-    def _validate(self, command: Command) -> str:
+    @classmethod
+    def _build_dispatch_table(cls) -> dict[type[Command], CommandRoute]:
+        """
+        Returns the routes of every command accepted in the fortify phase
+
+        Notes
+        -----
+        Extends the Save and Load routes of State with:
+
+        FortifyTerritoryCommand : _validate_fortify, _on_fortify
+        NextTurnCommand : _validate_next_turn, _on_next_turn
+        """
+        table = super()._build_dispatch_table()
+        table[FortifyTerritoryCommand] = CommandRoute(cls._validate_fortify, cls._on_fortify)
+        table[NextTurnCommand] = CommandRoute(cls._validate_next_turn, cls._on_next_turn)
+        return table
+
+    def _validate_fortify(self, command: FortifyTerritoryCommand) -> str:
+        """
+        Checks that the player has not fortified yet this 
+        turn(None assumes valid)
+        """
+
+    def _on_fortify(self, result: FortifyTerritoryEvent) -> None:
+        """
+        Ends the phase after the single fortification of the turn
+        """
+
+    def _validate_next_turn(self, command: NextTurnCommand) -> str:
+        """
+        Always valid in the fortify phase
+        """
+
+    def _on_next_turn(self, result: NextTurnEvent) -> None:
+        """
+        Calls _on_exit() before the move to the next player
+        """
+
+    def legal_actions(self) -> LegalActions:
+        """
+        Enumerates every legal action of current_player
+
+        Notes
+        -----
+        FORTIFY for every ordered pair of friendly territories where
+        the source has more than one unit and the pair is connected
+        under the fortify rules, with the source's units minus one 
+        as the amount. Under ADJCENT_FORTIFY pairs come from 
+        Board.adjacency, under CONTIGUOUS_FORTIFY from the labels of 
+        Board.friendly_components(). NEXT_TURN is always legal.
+        """
+
+    def pack(self) -> bytes:
+        """
+        Serialises the ephemeral data of the phase
+
+        Notes
+        -----
+        current_player uint8.
+        """
+
+    def unpack(self, data: bytes) -> None:
+        """
+        Restores current_player from pack()
+        """
+
+    def _validate(self, command: Command, route: CommandRoute = None) -> str:
         """
         Method that ensures command is of the correct subclass 
         
@@ -69,6 +146,8 @@ class FortificationState(State):
         ----------
         command : Command
             The command being validated
+        route : CommandRoute
+            The route resolved by execute()(None resolves it)
 
         Returns
         -------
@@ -79,7 +158,7 @@ class FortificationState(State):
         -----
         The allowed commands are: Load, Save, FortifyTerritory, NextTurn
         """
-        pass
+        return super()._validate(command, route)
 
     def execute(self, command: Command) -> None:
         """
@@ -102,11 +181,15 @@ class FortificationState(State):
         >>> game.execute(command)
         Andrew transferred 3 units to India from Brazil!
 
+        Delegates to State.execute(), so the command is routed 
+        through `dispatch_table` and the instrumentation check runs 
+        in this phase too.
+
         See Also
         --------
         _validate(), _on_execute()
         """
-        pass
+        super().execute(command)
 
     def _on_execute(self, result: ExplicitEvent) -> None:
         """
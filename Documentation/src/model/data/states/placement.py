@@ -1,7 +1,9 @@
-from ...utils.templates import State, Command, ImplicitEvent, ExplicitEvent
+from ...utils.templates import State, Command, CommandRoute, ImplicitEvent, ExplicitEvent
 from ...main.game import Game
 from __future__ import annotations
 from dataclasses import dataclass
+from ..commands import *
+from ...main.actions import LegalActions
 
 class Territory():#dummy for typing
     pass
@@ -87,13 +89,73 @@ class PlacementState(State):
         >>> command = PlaceUnitCommand(game.get_territory("India"), 1)
         >>> game.execute(command)
 
+        Delegates to State.execute(), so the command is routed 
+        through `dispatch_table` and the instrumentation check runs 
+        in this phase too.
+
         See Also
         --------
         _validate(), _on_execute()
         """
-        pass
+        super().execute(command)
+
+    @classmethod
+    def _build_dispatch_table(cls) -> dict[type[Command], CommandRoute]:
+        """
+        Returns the routes of every command accepted in the placement phase
+
+        Notes
+        -----
+        Extends the Save and Load routes of State with:
+
+        PlaceUnitCommand : _validate_place_unit, _on_place_unit
+        """
+        table = super()._build_dispatch_table()
+        table[PlaceUnitCommand] = CommandRoute(cls._validate_place_unit, cls._on_place_unit)
+        return table
+
+    def _validate_place_unit(self, command: PlaceUnitCommand) -> str:
+        """
+        Checks that the territory is unowned while any remain
+        unclaimed, else owned by current_player(None assumes valid)
+        """
+
+    def _on_place_unit(self, result: PlaceUnitEvent) -> None:
+        """
+        Assigns an unowned territory to the player and decrements
+        units_left
+        """
+
+    def legal_actions(self) -> LegalActions:
+        """
+        Enumerates every legal action of current_player
+
+        Notes
+        -----
+        PLACE for every unowned territory while any remain, else 
+        for every territory owned by current_player. Amounts are 
+        always 1.
+        """
+
+    def pack(self) -> bytes:
+        """
+        Serialises the ephemeral data of the phase
+
+        Notes
+        -----
+        current_player uint8, units_left uint16.
+        """
+
+    def unpack(self, data: bytes) -> None:
+        """
+        Restores current_player and units_left from pack()
+
+        Notes
+        -----
+        current_player is resolved from its player_id through game.
+        """
 
-    def _validate(self, command: Command) -> bool:
+    def _validate(self, command: Command, route: CommandRoute = None) -> str:
         """
         Method that ensures command is of the correct subclass 
         
@@ -101,17 +163,32 @@ class PlacementState(State):
         ----------
         command : Command
             The command being validated
+        route : CommandRoute
+            The route resolved by execute()(None resolves it)
 
         Returns
         -------
-        bool
-            True if valid command else False 
+        str
+            The accompanying error message(None assumes valid)
 
         Notes
         -----
         The passed command must be Save, Load, PlaceUnit
         """
-        pass
+        return super()._validate(command, route)
+
+    def _must_transition(self, result: ExplicitEvent) -> bool:
+        """
+        Returns True if `result` needs _on_execute() immediately
+        during execute_many()
+
+        Notes
+        -----
+        Rolling to the next player when units_left reaches zero
+        must happen immediately, since the following PlaceUnitCommand
+        belongs to that player. The switch from the claiming to the
+        fortifying subphase and the end of the phase are deferred.
+        """
 
     def _on_execute(self, result: ExplicitEvent) -> None:
         """
@@ -1,7 +1,9 @@
-from ...utils.templates import State, Command, ImplicitEvent, ExplicitEvent
+from ...utils.templates import State, Command, CommandRoute, ImplicitEvent, ExplicitEvent
 from ...main.game import Game
 from __future__ import annotations
 from dataclasses import dataclass
+from ..commands import *
+from ...main.actions import LegalActions
 
 class Territory:
     pass
@@ -43,6 +45,16 @@ class RecruitmentState(State):
         """
         pass
 
+    def reset(self) -> None:
+        """
+        Restores the ephemeral data of RecruitmentState for a new turn
+
+        Notes
+        -----
+        Sets current_player to the front of the player queue and
+        units_left to zero. units_left is recalculated in on_enter().
+        """
+
     def on_enter(self):
         """
         Called directly after initialisation of RecruitmentState
@@ -93,13 +105,99 @@ class RecruitmentState(State):
         >>> command = RecruitUnitCommand("Ontario", 10)
         >>> game.execute(command)
 
+        Delegates to State.execute(), so the command is routed 
+        through `dispatch_table` and the instrumentation check runs 
+        in this phase too.
+
         See Also
         --------
         _validate(), _on_execute()
         """
-        pass
+        super().execute(command)
+
+    @classmethod
+    def _build_dispatch_table(cls) -> dict[type[Command], CommandRoute]:
+        """
+        Returns the routes of every command accepted in the recruitment phase
+
+        Notes
+        -----
+        Extends the Save and Load routes of State with:
+
+        TradeSetCommand : _validate_trade_set, _on_trade_set
+        RecruitUnitCommand : _validate_recruit, _on_recruit
+        NextTurnCommand : _validate_next_turn, _on_next_turn
+        """
+        table = super()._build_dispatch_table()
+        table[TradeSetCommand] = CommandRoute(cls._validate_trade_set, cls._on_trade_set)
+        table[RecruitUnitCommand] = CommandRoute(cls._validate_recruit, cls._on_recruit)
+        table[NextTurnCommand] = CommandRoute(cls._validate_next_turn, cls._on_next_turn)
+        return table
+
+    def _validate_trade_set(self, command: TradeSetCommand) -> str:
+        """
+        Checks that the player holds the cards of the set(None
+        assumes valid)
+        """
+
+    def _on_trade_set(self, result: TradeSetEvent) -> None:
+        """
+        Adds the units received to units_left
+        """
+
+    def _validate_recruit(self, command: RecruitUnitCommand) -> str:
+        """
+        Checks that the count does not exceed units_left(None 
+        assumes valid)
+        """
+
+    def _on_recruit(self, result: RecruitUnitEvent) -> None:
+        """
+        Subtracts the units placed from units_left
+        """
+
+    def _validate_next_turn(self, command: NextTurnCommand) -> str:
+        """
+        Checks that units_left is zero and no trade is 
+        required(None assumes valid)
+        """
+
+    def _on_next_turn(self, result: NextTurnEvent) -> None:
+        """
+        Calls _on_exit() before the move to the attack phase
+        """
 
-    def _validate(self, command: Command) -> str:
+    def legal_actions(self) -> LegalActions:
+        """
+        Enumerates every legal action of current_player
+
+        Notes
+        -----
+        TRADE_SET for every combination of current_player's cards
+        that forms a valid set, RECRUIT for every friendly territory
+        with units_left as the amount, and NEXT_TURN once units_left
+        is zero and no trade is required.
+        """
+
+    def pack(self) -> bytes:
+        """
+        Serialises the ephemeral data of the phase
+
+        Notes
+        -----
+        current_player uint8, units_left uint16.
+        """
+
+    def unpack(self, data: bytes) -> None:
+        """
+        Restores current_player and units_left from pack()
+
+        Notes
+        -----
+        current_player is resolved from its player_id through game.
+        """
+
+    def _validate(self, command: Command, route: CommandRoute = None) -> str:
         """
         Method that ensures command is of the correct subclass 
         
@@ -107,6 +205,8 @@ class RecruitmentState(State):
         ----------
         command : Command
             The command being validated
+        route : CommandRoute
+            The route resolved by execute()(None resolves it)
 
         Returns
         -------
@@ -119,7 +219,20 @@ class RecruitmentState(State):
         Save, Load
 
         """
-        pass
+        return super()._validate(command, route)
+
+    def _must_transition(self, result: ExplicitEvent) -> bool:
+        """
+        Returns True if `result` needs _on_execute() immediately
+        during execute_many()
+
+        Notes
+        -----
+        Deferred for RecruitUnitEvent and TradeSetEvent: the 
+        automatic move to the attack phase when units_left reaches 
+        zero is checked once at the end of the batch. A successful
+        NextTurnEvent transitions immediately.
+        """
 
     def _on_execute(self, result: ExplicitEvent) -> None:
         """
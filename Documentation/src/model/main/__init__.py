@@ -1,3 +1,10 @@
 from data import *
 from game import *
+from actions import *
+from save_format import *
+from save_chain import *
+from save_catalogue import *
+from compression import *
+from autosave import *
+from journal import *
 from model.main.rules import *
\ No newline at end of file
@@ -0,0 +1,126 @@
+from __future__ import annotations
+from array import array
+from dataclasses import dataclass
+from ..utils import Command, ActionKind
+
+class Board:
+    pass
+
+class Game:
+    pass
+
+@dataclass
+class LegalActions:
+    """
+    The legal actions of the current player in the current State
+
+    Attributes
+    ----------
+    actions : array[int]
+        The action ids of every legal action
+    amounts : array[int]
+        For each entry of `actions`, the maximum number of units it
+        can move or place(1 for actions without an amount). The
+        minimum is 1, or the attacker dice for a captured territory
+    mask : bytearray
+        1 at the index of every legal action id, of length 
+        ActionSpace.size
+
+    Notes
+    -----
+    Buffers are owned by the State and overwritten by the next call
+    to legal_actions(), so callers must copy them to keep them.
+    """
+    actions: array
+    amounts: array
+    mask: bytearray
+
+class ActionSpace:
+    def __init__(self, board: Board, max_hand: int = 12):
+        """
+        Fixed integer encoding of every action on a map
+
+        Parameters
+        ----------
+        board : Board
+            The board the actions refer to
+        max_hand : int
+            The largest hand size trade sets are encoded for
+
+        Attributes
+        ----------
+        size : int
+            The total number of action ids
+        offsets : dict[ActionKind, int]
+            The first action id of each kind
+        edges : array[int]
+            The (territory_from, territory_to) pair of every directed
+            edge of the map, flattened. FOCUS action ids index it
+        trade_sets : list[tuple[int, int, int]]
+            The hand positions of every combination of three cards
+            up to `max_hand`. TRADE_SET action ids index it
+
+        Notes
+        -----
+        Blocks, in order:
+
+        PLACE, RECRUIT : one id per territory
+        FOCUS : one id per directed edge
+        FORTIFY : one id per ordered pair of territories
+        TRANSFER, CANCEL_FOCUS, ATTACK_MANUAL, ATTACK_SIMULATE, 
+        NEXT_TURN : one id each
+        ATTACKER_DICE : three ids, one per dice count
+        DEFENDER_DICE : two ids, one per dice count
+        TRADE_SET : one id per entry of trade_sets
+
+        Only depends on the map and `max_hand`, so it is built once
+        per map and shared between games.
+        """
+
+    def kind(self, action_id: int) -> ActionKind:
+        """
+        Returns the kind of `action_id`
+
+        Notes
+        -----
+        Bisects `offsets`.
+        """
+
+    def encode(self, command: Command) -> tuple[int, int]:
+        """
+        Returns the action id and amount of `command`
+
+        Parameters
+        ----------
+        command : Command
+            A command built with territory ids
+
+        Returns
+        -------
+        tuple[int, int]
+            The action id and the amount(1 if the command has none)
+        """
+
+    def decode(self, game: Game, action_id: int, amount: int = 1) -> Command:
+        """
+        Builds the command for an action id
+
+        Parameters
+        ----------
+        game : Game
+            The game the command will be executed on
+        action_id : int
+            The id of the action
+        amount : int
+            The number of units, for RECRUIT, TRANSFER and FORTIFY
+
+        Returns
+        -------
+        Command
+            The command for the action
+
+        Notes
+        -----
+        Only called for the action actually chosen, never while
+        generating legal actions.
+        """
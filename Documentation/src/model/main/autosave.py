@@ -0,0 +1,139 @@
+from __future__ import annotations
+from ..utils import Event
+from .compression import BlockCodec
+
+class Game:
+    pass
+
+class AutosaveService:
+    def __init__(self,
+                game: Game,
+                file_name: str = "autosave",
+                codec: BlockCodec = None
+                ):
+        """
+        Saves the game at the start of every turn and at the end of 
+        the game without blocking it
+
+        Parameters
+        ----------
+        game : Game
+            The game being saved
+        file_name : str
+            The name of the save in `\saves`
+        codec : BlockCodec
+            The compression of the save(None for no compression)
+
+        Attributes
+        ----------
+        game : Game
+            The game being saved
+        file_name : str
+            The name of the save in `\saves`
+        codec : BlockCodec
+            The compression of the save(None for no compression)
+        latest : tuple[int, bytes]
+            The turn and encoded snapshot waiting to be written(None
+            if the writer is idle)
+        written_turn : int
+            The turn of the last snapshot written successfully
+        writer : threading.Thread
+            The daemon thread writing snapshots
+
+        Notes
+        -----
+        The game thread only runs encode_game(game) without a codec,
+        which copies the compact board arrays and packs the State. 
+        `writer` compresses that snapshot with compress_sections() 
+        when `codec` is set, then writes it and updates the 
+        catalogue.
+
+        Snapshots are coalesced: `latest` holds a single slot guarded
+        by a threading.Condition, and a new snapshot replaces one the
+        writer has not picked up yet. Only the newest turn is ever 
+        written, so a slow disk delays autosaves but never queues 
+        them up.
+
+        Autosave overwrites its file without asking, unlike 
+        Game.save_game(). Files are written with write-then-rename,
+        so a crash mid-write keeps the previous autosave.
+        """
+
+    def attach(self) -> None:
+        """
+        Subscribes the service to the start of every turn and to 
+        the end of the game
+
+        Notes
+        -----
+        Subscribes on_turn_start to RecruitmentPhaseStartedEvent 
+        and EndPhaseStartedEvent as an INLINE subscriber, since the
+        snapshot must be taken on the game thread before the next 
+        command runs. Starts `writer`.
+
+        RecruitmentPhaseStartedEvent is emitted from 
+        RecruitmentState.on_enter(), after next_phase() has rotated
+        the player queue, reseeded rng and installed the state, and
+        after units_left is set. A snapshot taken then loads into 
+        the new player's recruitment phase. FortifyPhaseEndedEvent 
+        is not used, since it fires before the transition and would
+        record the finished player still in FortificationState.
+
+        EndPhaseStartedEvent saves the finished game, which never 
+        reaches another recruitment phase.
+        """
+
+    def on_turn_start(self, event: Event) -> None:
+        """
+        Takes a snapshot and hands it to the writer
+
+        Parameters
+        ----------
+        event : Event
+            The RecruitmentPhaseStartedEvent of the new turn or the
+            EndPhaseStartedEvent of the game
+
+        Notes
+        -----
+        Never waits for the writer.
+        """
+
+    def _write_loop(self) -> None:
+        """
+        Body of `writer`
+
+        Notes
+        -----
+        Waits on the condition, takes `latest` and clears the slot,
+        then writes it outside the lock. After each write, emits a 
+        SaveEvent on the game's event bus with success, error and
+        filename set. Being off the game thread, the emit only puts
+        the SaveEvent on the bus's `deferred` queue, and subscribers
+        receive it on the game thread from 
+        EventBus.deliver_deferred(), like any other deferred event.
+
+        The catalogue entry of the save is updated through 
+        SaveCatalogue.shared(), the same instance SaveCommand uses
+        on the game thread, whose lock serialises the two updates.
+        """
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Waits until the latest snapshot is written
+
+        Returns
+        -------
+        bool
+            False if `timeout` expired first
+
+        Notes
+        -----
+        Called on the game thread. Calls 
+        EventBus.deliver_deferred() before returning, so the 
+        SaveEvent of the flushed snapshot has been delivered.
+        """
+
+    def close(self) -> None:
+        """
+        Writes any pending snapshot and stops `writer`
+        """
@@ -0,0 +1,130 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+
+class BlockCodec(ABC):
+    """
+    Abstract class for the compression applied to each block of a
+    save or journal.
+
+    Attributes
+    ----------
+    codec_id : int
+        The id written in block headers(0 is reserved for no 
+        compression)
+    name : str
+        The name used to pick the codec
+
+    Notes
+    -----
+    Blocks are compressed independently, so any block can be read
+    without decompressing the ones before it.
+    """
+    codec_id: int
+    name: str
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """
+        Returns `data` compressed as one block
+        """
+
+    @abstractmethod
+    def decompress(self, data: bytes, raw_length: int) -> bytes:
+        """
+        Returns the block decompressed
+
+        Parameters
+        ----------
+        data : bytes
+            The compressed block
+        raw_length : int
+            The length of the block before compression, used to 
+            size the output buffer
+        """
+
+class NullCodec(BlockCodec):
+    """
+    Stores blocks as they are
+    """
+    codec_id = 0
+    name = "none"
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        Returns `data` unchanged
+        """
+
+    def decompress(self, data: bytes, raw_length: int) -> bytes:
+        """
+        Returns `data` unchanged
+        """
+
+class ZlibCodec(BlockCodec):
+    def __init__(self, level: int = 6):
+        """
+        Block compression with zlib
+
+        Parameters
+        ----------
+        level : int
+            The zlib compression level
+        """
+    codec_id = 1
+    name = "zlib"
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        Returns zlib.compress(data, level)
+        """
+
+    def decompress(self, data: bytes, raw_length: int) -> bytes:
+        """
+        Returns zlib.decompress(data, bufsize=raw_length)
+        """
+
+class LzmaCodec(BlockCodec):
+    def __init__(self, preset: int = 1):
+        """
+        Block compression with lzma, using FORMAT_RAW to avoid the
+        per-block container overhead
+
+        Parameters
+        ----------
+        preset : int
+            The lzma preset
+        """
+    codec_id = 2
+    name = "lzma"
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        Returns `data` compressed with lzma.LZMACompressor using 
+        FORMAT_RAW and the filters of `preset`
+        """
+
+    def decompress(self, data: bytes, raw_length: int) -> bytes:
+        """
+        Returns `data` decompressed with lzma.LZMADecompressor, 
+        stopping at raw_length bytes
+        """
+
+CODECS: dict[int, BlockCodec] = {}
+"""
+Every registered codec by codec_id
+"""
+
+def register_codec(codec: BlockCodec) -> None:
+    """
+    Makes a codec available to readers and writers
+
+    Notes
+    -----
+    Raises ValueError if codec_id is already taken by a different 
+    codec. NullCodec, ZlibCodec and LzmaCodec are registered on 
+    import.
+    """
+
+def get_codec(key: int | str) -> BlockCodec:
+    """
+    Returns the codec registered under an id or a name
+    """
@@ -1,4 +1,4 @@
-from typing import Self, Any
+from typing import Self, Any, Iterable
 from dataclasses import dataclass
 from __future__ import annotations
 from ..utils import *
@@ -8,6 +8,15 @@ from datetime import datetime
 class Deck:
     pass
 
+class EventJournal:
+    pass
+
+class ActionSpace:
+    pass
+
+class LegalActions:
+    pass
+
 class Game:
     def __init__(self, 
                 metadata: GameMetadata, 
@@ -38,6 +47,34 @@ class Game:
 
         stats : GameStats
             Container for high-level statistics of the game
+
+        _state_pool : dict[type[State], State]
+            One reusable instance per State class, filled lazily
+            by _get_state()
+
+        record_undo : bool
+            If True, every command records a CommandDelta(default 
+            False, so normal play pays nothing for it)
+
+        undo_stack : Stack[CommandDelta]
+            The deltas of executed commands, latest on top
+
+        redo_stack : Stack[CommandDelta]
+            The deltas of undone commands, latest on top
+
+        instrumentation : Instrumentation
+            Latency histograms of executed commands(None when 
+            disabled, the default)
+
+        _save_chains : dict[str, SaveChain]
+            The open delta chain of every file name saved with 
+            SaveMode.DELTA
+
+        Notes
+        -----
+        The thread constructing the game is its game thread. It 
+        calls data.event_bus.bind_game_thread(), so events emitted
+        from other threads are deferred to it.
         """
 
     def __repr__(self) -> str:
@@ -107,6 +144,10 @@ class Game:
         -----
         This method loads from `\saves` as a side effect, and does not return anything.
 
+        The file is read with decode_game() from save_format.
+        Listing saves should use SaveCatalogue or peek_save() 
+        instead, which never read the body.
+
         Example
         -------
         >>> game_object = Game.load_game("SavedGame1")
@@ -118,6 +159,22 @@ class Game:
         """
         pass
     
+    @classmethod
+    def peek_save(cls, file_name: str) -> GameMetadata:
+        """
+        Returns the metadata of a save without loading it
+
+        Parameters
+        ----------
+        file_name : str
+            The name of the file in `\saves`
+
+        Notes
+        -----
+        Reads only the fixed header with peek_save() from 
+        save_catalogue.
+        """
+
     @property 
     def event_bus(self) -> EventBus:
         """
@@ -166,7 +223,75 @@ class Game:
         Returns the Rules in data
         """
 
-    def save_game(self, file_name: str) -> None:
+    @property
+    def profile(self) -> EngineProfile:
+        """
+        Returns the EngineProfile of the game
+
+        Notes
+        -----
+        metadata.profile, or EngineProfile.for_mode(metadata.gamemode)
+        when it is None. Code reading profile switches goes through
+        this property rather than metadata.profile.
+        """
+        profile = self.metadata.profile
+        if profile is None:
+            profile = EngineProfile.for_mode(self.metadata.gamemode)
+        return profile
+
+    @property
+    def action_space(self) -> ActionSpace:
+        """
+        Returns the ActionSpace of the game's map
+        """
+
+    @property
+    def position_hash(self) -> int:
+        """
+        Returns a 64-bit hash of the position
+
+        Notes
+        -----
+        Board.zobrist XOR the key of the State class XOR 
+        Deck.card_zobrist, XOR a 64-bit hash of State.pack(). 
+        The packed State covers the current player, units_left, 
+        unplaced_units, has_captured_territory, the sub-state flags
+        and the offensive front, so two positions with different 
+        legal actions never share a hash except by collision. Card
+        keys are kept per (card, holder) and updated as cards move,
+        so the cost is O(size of State.pack()), independent of the
+        map size. Used by search bots as a transposition key.
+        """
+
+    def fork(self) -> Game:
+        """
+        Returns an independent copy of the game for search
+
+        Returns
+        -------
+        Game
+            decode_game(encode_game(self)) with record_undo set
+
+        Notes
+        -----
+        The copy has its own EventBus with no subscribers, no 
+        journal, no autosave and no instrumentation, so the commands
+        a search explores are never journaled or seen by the UI,
+        ThreatMap or other subscribers of the original. Forking 
+        costs about as much as one save, so searches fork once per
+        decision and branch the copy with execute() and undo().
+        """
+
+    def legal_actions(self) -> LegalActions:
+        """
+        Returns the legal actions of the current State
+
+        Notes
+        -----
+        Forwards to State.legal_actions().
+        """
+
+    def save_game(self, file_name: str, mode: SaveMode = SaveMode.FULL) -> None:
         """
         Procedure that exports the game data into a new 
         file labelled `file_name` into `\saves`.
@@ -175,6 +300,9 @@ class Game:
         ----------
         file_name : str
             The name of the file being exported
+        mode : SaveMode
+            FULL writes a snapshot, DELTA appends to the SaveChain
+            of `file_name`, which is kept in _save_chains
 
         Notes
         -----
@@ -182,6 +310,9 @@ class Game:
 
         If another file with the same name is already in `\saves`, 
         ask  the user to confirm before overwriting the new file.
+
+        The file is `file_name` + SAVE_EXTENSION, written with 
+        encode_game() from save_format.
         """
         pass
     
@@ -194,6 +325,145 @@ class Game:
         -----
         Acts as a handler which forwards the request
         to the State.
+
+        If a journal is attached, the command is recorded
+        with journal.record_command() before being forwarded.
+
+        Afterwards calls event_bus.deliver_deferred(), so events 
+        emitted off the game thread, such as the errors of THREADED
+        subscribers, reach INLINE subscribers on the game thread.
+        """
+
+    def execute_many(self, commands: Iterable[Command]) -> list[ExplicitEvent]:
+        """
+        Executes a sequence of commands in order
+
+        Parameters
+        ----------
+        commands : Iterable[Command]
+            The commands being executed. May be a generator
+
+        Returns
+        -------
+        list[ExplicitEvent]
+            One result per command, in the same order
+
+        Notes
+        -----
+        Forwards the whole sequence to State.execute_many() rather 
+        than calling execute() per command. Every command is still
+        recorded by the journal if one is attached.
+
+        Example
+        -------
+        >>> results = game.execute_many(
+                PlaceUnitCommand(game, territory) for territory in targets)
+        >>> [result.success for result in results]
+        [True, True, False]
+        """
+
+    def random_below(self, n: int) -> int:
+        """
+        Returns a random int in [0, n) from rng
+
+        Notes
+        -----
+        int(rng.random() * n), which consumes the same amount of the
+        generator whatever `n` is, and adds one to data.rng_draws. 
+        Every dice roll, card draw and automatic placement goes 
+        through here, so (rng_seed, rng_draws) is the position of 
+        rng.
+        """
+
+    def seek_rng(self, seed: int, draws: int) -> None:
+        """
+        Moves rng to a position recorded in a CommandDelta
+
+        Notes
+        -----
+        Reseeds rng with `seed` and calls rng.random() `draws` 
+        times, so the cost is the number of draws in the turn. When
+        `seed` equals data.rng_seed and `draws` is ahead of 
+        data.rng_draws, only the difference is drawn.
+        """
+
+    def undo(self) -> bool:
+        """
+        Reverts the last executed command
+
+        Returns
+        -------
+        bool
+            False if there was nothing to undo
+
+        Notes
+        -----
+        Pops the CommandDelta from undo_stack, calls revert() on it
+        and pushes it onto redo_stack. No events are emitted. If a 
+        journal is attached, an UNDO record is written with 
+        journal.record_history(), so replaying the journal reaches 
+        the same position.
+
+        Example
+        -------
+        >>> game.record_undo = True
+        >>> game.execute(AttackManualCommand())
+        >>> game.undo()
+        True
+        >>> game.redo()
+        True
+        """
+
+    def redo(self) -> bool:
+        """
+        Re-applies the last undone command
+
+        Returns
+        -------
+        bool
+            False if there was nothing to redo
+
+        Notes
+        -----
+        Pops the CommandDelta from redo_stack, calls apply() on it
+        and pushes it back onto undo_stack. Executing any new 
+        command clears redo_stack. If a journal is attached, a REDO
+        record is written with journal.record_history().
+        """
+
+    def enable_instrumentation(self, enabled: bool = True) -> Instrumentation:
+        """
+        Starts or stops recording command latencies
+
+        Parameters
+        ----------
+        enabled : bool
+            False sets instrumentation back to None
+
+        Returns
+        -------
+        Instrumentation
+            The instrumentation now in use(None if disabled)
+
+        Notes
+        -----
+        Sets the same Instrumentation on the event bus, so emission
+        time is attributed to the command that caused it.
+        """
+
+    def attach_journal(self, journal: EventJournal) -> None:
+        """
+        Records every command and event of the game into `journal`
+
+        Parameters
+        ----------
+        journal : EventJournal
+            The journal the game is streamed to
+
+        Notes
+        -----
+        Calls journal.attach(self). Only one journal can be
+        attached at a time.
         """
 
     def get_territory(self, name: str) -> Territory:
@@ -216,6 +486,26 @@ class Game:
         the enum in the game object.
         """
     
+    def get_territory_by_id(self, territory_id: int) -> Territory:
+        """
+        Finds the territory associated with the given id
+
+        Parameters
+        ----------
+        territory_id : int
+            The index of the territory in Board's arrays
+
+        Returns
+        -------
+        Territory
+            The associated territory
+
+        Notes
+        -----
+        A list index, used instead of get_territory() when
+        the profile has use_ids set.
+        """
+
     def get_continent(self, name: str) -> Territory:
         """
         Finds the continent associated with the given name
@@ -238,19 +528,50 @@ class Game:
 
     def next_phase(self) -> None:
         """
-        Creates the next phase object and calls
+        Fetches the next phase object and calls
         on_start()
         
         Notes
         -----
         Should replace the State object in gamedata
         with the next applicable game state. 
+
+        The state is taken from the pool with _get_state() 
+        instead of being constructed. The previous state's
+        on_exit() is still called before the switch.
         
         Note that this does not cover the end phase.
         AttackPhase should handle this separately
 
         Placement -> [Recruitment -> Attack
         -> Fortify -> Recruitment] LOOP 
+
+        When a new turn starts, draws a seed from rng, reseeds
+        rng with it and passes it to journal.record_turn() if a
+        journal is attached. data.rng_seed is set to the seed and
+        data.rng_draws to zero.
+        """
+
+    def _get_state(self, state_class: type[State]) -> State:
+        """
+        Returns the pooled instance of `state_class`, ready to enter
+
+        Parameters
+        ----------
+        state_class : type[State]
+            The class of the state being entered
+
+        Returns
+        -------
+        State
+            The one instance of `state_class` owned by this game
+
+        Notes
+        -----
+        Looks up `state_class` in _state_pool and constructs it
+        on the first miss only. Calls reset() on the instance 
+        before returning it, so callers only need to call 
+        on_enter().
         """
 
     def set_end_phase(self) -> None:
@@ -281,9 +602,69 @@ class GameMetadata:
         The number of players at instantiation of the game
     rules : GameRules 
         The rules defined at the start of the game 
+    seed : int
+        The seed of the game's RNG. Every dice roll, card
+        draw and automatic placement is derived from it
+    profile : EngineProfile
+        How the engine trades readability for speed(None assumes
+        EngineProfile.for_mode(gamemode))
 
         """
 
+@dataclass(frozen=True)
+class EngineProfile:
+    """
+    Switches that control how much work `Game` does for humans.
+
+    Attributes
+    ----------
+    format_messages : bool
+        If False, States and Commands never build display strings.
+        _validate() returns a short constant error code instead of 
+        a formatted message(None still assumes valid)
+    emit_events : bool
+        If False, events are only built and emitted for event types
+        that have a subscriber, checked with EventBus.wants()
+    use_ids : bool
+        If True, Commands carry territory and player ids and are
+        resolved with Board.get_territory_from_id() instead of
+        name lookups
+    compact_board : bool
+        If True, the Territory objects are not kept in sync with 
+        Board's flat arrays during play. The arrays themselves are
+        maintained under every profile
+
+    Notes
+    -----
+    Read-only once the game is created.
+    """
+
+    @classmethod
+    def interactive(cls) -> EngineProfile:
+        """
+        Returns the profile for LOCAL_PLAY: every switch set for
+        readability
+        """
+
+    @classmethod
+    def headless(cls) -> EngineProfile:
+        """
+        Returns the profile for SIMULATION and TRAINING: no message
+        formatting, opt-in events, id lookups and the compact board
+
+        Notes
+        -----
+        Target throughput is at least 1,000 complete four player 
+        games per second per core on the traditional map, tracked
+        by benchmarks/engine_throughput.py.
+        """
+
+    @classmethod
+    def for_mode(cls, gamemode: GameMode) -> EngineProfile:
+        """
+        Returns interactive() for LOCAL_PLAY, headless() otherwise
+        """
+
 @dataclass
 class GameData:
     """
@@ -308,6 +689,16 @@ class GameData:
         A stack containing the cards not yet drawn
     rules : GameRules 
         The rules defined at the start of the game 
+    rng : Random
+        The random number generator for dice, cards and
+        automatic placement. Reseeded at the start of every
+        turn with a seed drawn from itself
+    rng_seed : int
+        The seed rng was last reseeded with
+    rng_draws : int
+        The number of draws from rng since it was reseeded
+    journal : EventJournal
+        The journal recording the game(None if not recorded)
     """
 
 @dataclass
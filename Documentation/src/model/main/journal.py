@@ -0,0 +1,305 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from enum import Enum
+from typing import Self
+from ..utils import Command, Event, EventBus
+from .compression import BlockCodec
+
+class Game:
+    pass
+
+class JournalRecordType(Enum):
+    """
+    The kinds of record stored in a journal
+
+    Attributes
+    ----------
+    HEADER
+        The GameMetadata the game was created with
+    TURN
+        A marker written when a new player turn starts, carrying
+        the RNG seed used for that turn
+    CHECKPOINT
+        encode_game() of the game at the start of an indexed turn
+    COMMAND
+        A command passed to Game.execute
+    EXPLICIT_EVENT
+        An event returned by a command
+    IMPLICIT_EVENT
+        An event emitted by State
+    UNDO
+        Game.undo() reverted the last command
+    REDO
+        Game.redo() re-applied the last undone command
+    """
+
+@dataclass
+class JournalRecord:
+    """
+    A single entry of the journal
+
+    Attributes
+    ----------
+    record_type : JournalRecordType
+        What the payload contains
+    turn : int
+        The player turn the record was written in, counted from 0
+        and advanced by every TURN record
+    payload : bytes
+        The encoded command, event, seed or metadata
+
+    Notes
+    -----
+    Inside a block, each record is written as:
+
+    length : uint32 (little endian, excludes itself)
+    record_type : uint8
+    turn : uint32
+    payload : bytes
+
+    The length prefix lets the reader skip records it does not
+    need (e.g. events during replay) without decoding them.
+    """
+
+class EventJournal:
+    def __init__(self,
+                file_name: str,
+                fsync_every: int = 64,
+                index_stride: int = 10,
+                codec: BlockCodec = None
+                ):
+        """
+        An append-only binary log of everything that happens in a `Game`
+
+        Parameters
+        ----------
+        file_name : str
+            The name of the journal file in `\saves`
+        fsync_every : int
+            The number of records written between calls to os.fsync
+        index_stride : int
+            The number of player turns between checkpoints
+        codec : BlockCodec
+            Compresses each block of records(None stores them as
+            they are)
+
+        Attributes
+        ----------
+        file_name : str
+            The name of the journal file in `\saves`
+        fsync_every : int
+            The number of records written between calls to os.fsync
+        index_stride : int
+            The number of player turns between checkpoints
+        player_turn : int
+            The number of TURN records written so far
+        turn_index : dict[int, int]
+            Sparse map of player turn to the byte offset of the
+            block starting with its TURN and CHECKPOINT records
+        pending : int
+            The number of records written since the last fsync
+
+        Notes
+        -----
+        The file is opened in append mode and is never rewritten,
+        so a crash can at most lose the records since the last fsync.
+        A truncated final record is detected by its length prefix and
+        ignored on read.
+
+        The turn index is written to a sidecar file
+        (`file_name` + ".idx") on every fsync.
+
+        Records are buffered into blocks. A block is written on every
+        fsync and at every indexed turn, framed as stored length 
+        uint32, raw length uint32 and codec_id uint8, and compressed
+        with `codec` on its own. Indexed turns always start a block,
+        so seeking to them never decompresses earlier blocks.
+
+        Turns are counted per player turn by the journal itself, not
+        with GameStats.turns_played, which counts rounds. Every 
+        player turn therefore has its own key in `turn_index`.
+        """
+
+    def attach(self, game: Game) -> None:
+        """
+        Subscribes the journal to every event of `game`
+
+        Parameters
+        ----------
+        game : Game
+            The game being recorded
+
+        Notes
+        -----
+        Writes the HEADER record, subscribes `on_event` to
+        ExplicitEvent and ImplicitEvent on the event bus and
+        registers itself with Game so that `record_command` is
+        called before each command is forwarded to State.
+        """
+
+    def record_command(self, command: Command) -> None:
+        """
+        Appends the originating command to the journal
+
+        Parameters
+        ----------
+        command : Command
+            The command passed to Game.execute
+
+        Notes
+        -----
+        Commands are encoded by their class and arguments. Territories
+        and players are written as their ids, never as names or objects.
+        """
+
+    def record_turn(self, seed: int) -> None:
+        """
+        Appends a TURN record and advances `player_turn`
+
+        Parameters
+        ----------
+        seed : int
+            The seed the game's RNG was reseeded with for this turn
+
+        Notes
+        -----
+        Every `index_stride`-th player turn starts a new block, is
+        added to `turn_index` and is followed by a CHECKPOINT record
+        holding encode_game() of the attached game, taken after the
+        reseed.
+        """
+
+    def record_history(self, record_type: JournalRecordType) -> None:
+        """
+        Appends an UNDO or REDO record
+
+        Parameters
+        ----------
+        record_type : JournalRecordType
+            UNDO or REDO
+
+        Notes
+        -----
+        The record has an empty payload. The delta itself is not 
+        written, since replay rebuilds it by re-executing the 
+        commands before it.
+        """
+
+    def on_event(self, event: Event) -> None:
+        """
+        Subscriber that appends every emitted event to the journal
+
+        Parameters
+        ----------
+        event : Event
+            The event emitted by Game
+        """
+
+    def flush(self) -> None:
+        """
+        Forces the buffered records to disk
+
+        Notes
+        -----
+        Calls os.fsync on the journal and rewrites the index
+        sidecar. Called automatically every `fsync_every` records
+        and on close.
+        """
+
+    def close(self) -> None:
+        """
+        Flushes and closes the journal
+        """
+
+class JournalReplayer:
+    def __init__(self, file_name: str):
+        """
+        Rebuilds a `Game` from a journal written by `EventJournal`
+
+        Parameters
+        ----------
+        file_name : str
+            The name of the journal file in `\saves`
+
+        Attributes
+        ----------
+        file_name : str
+            The name of the journal file in `\saves`
+        metadata : GameMetadata
+            The metadata read from the HEADER record
+        turn_index : dict[int, int]
+            The sparse player turn index read from the sidecar file
+
+        Notes
+        -----
+        If the sidecar file is missing or stale, the index is
+        rebuilt by scanning the length prefixes of the journal.
+        """
+
+    def replay(self, until_turn: int = None) -> Game:
+        """
+        Creates a new game and re-applies the recorded commands
+
+        Parameters
+        ----------
+        until_turn : int
+            The player turn to stop at(None replays the whole 
+            journal)
+
+        Returns
+        -------
+        Game
+            The game in the position reached at the start of
+            `until_turn`
+
+        Notes
+        -----
+        The game is created with Game.create_game using `metadata`
+        and the event bus is muted for the whole replay, so no
+        subscriber is called. EXPLICIT_EVENT, IMPLICIT_EVENT and
+        CHECKPOINT records are skipped by their length prefix. Each TURN record
+        reseeds the game's RNG with the recorded seed, so dice rolls
+        and card draws come out identical to the original game.
+
+        record_undo is set on the replayed game, and UNDO and REDO
+        records call Game.undo() and Game.redo() on it.
+        """
+
+    def seek(self, turn: int) -> Game:
+        """
+        Returns the game at the start of `turn`
+
+        Parameters
+        ----------
+        turn : int
+            The player turn being seeked to
+
+        Returns
+        -------
+        Game
+            The game in the position reached at the start of `turn`
+
+        Notes
+        -----
+        Uses `turn_index` to find the latest indexed turn at or 
+        before `turn`, restores the game from its CHECKPOINT record
+        with decode_game() and replays only the commands between 
+        that checkpoint and `turn`, as in replay(). At most 
+        `index_stride` player turns are replayed whatever the length
+        of the journal.
+        """
+
+    def records(self, record_type: JournalRecordType = None):
+        """
+        Generator over the records of the journal
+
+        Parameters
+        ----------
+        record_type : JournalRecordType
+            Only yield records of this type(None yields every record)
+
+        Yields
+        ------
+        JournalRecord
+            The next record in the journal
+        """
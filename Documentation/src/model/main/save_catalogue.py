@@ -0,0 +1,160 @@
+from __future__ import annotations
+from dataclasses import dataclass
+import struct
+
+class GameMetadata:
+    pass
+
+class SaveHeader:
+    pass
+
+CATALOGUE_FILE = "catalogue.idx"
+
+CATALOGUE_ENTRY_FORMAT = struct.Struct("<64sQdBB5BQIQd")
+"""
+file_name (UTF-8, zero padded), game_id, timestamp, gamemode,
+total_players, the five GameRules fields, seed, turns_played,
+file size, modification time
+"""
+
+@dataclass
+class CatalogueEntry:
+    """
+    What the load screen needs to know about one save
+
+    Attributes
+    ----------
+    file_name : str
+        The name of the save in `\saves`
+    metadata : GameMetadata
+        The metadata from the save's header
+    turns_played : int
+        GameStats.turns_played at the time of the save
+    size : int
+        The size of the save in bytes, including any delta chain
+    modified : float
+        The POSIX time the save was last written
+    """
+
+class SaveCatalogue:
+    def __init__(self, directory: str = "saves"):
+        """
+        Index of every save in a directory, kept in one file
+
+        Parameters
+        ----------
+        directory : str
+            The saves directory
+
+        Attributes
+        ----------
+        directory : str
+            The saves directory
+        entries : dict[str, CatalogueEntry]
+            The entry of every save by file name
+        lock : threading.Lock
+            Held by update(), remove() and rebuild() for the whole
+            change of `entries` and rewrite of the file
+
+        Notes
+        -----
+        The catalogue is CATALOGUE_FILE in `directory`, a count 
+        followed by CATALOGUE_ENTRY_FORMAT records. It is read in 
+        one call and rewritten with write-then-rename on every
+        update, so listing saves never opens a save.
+
+        SaveCommand runs on the game thread and AutosaveService on 
+        its writer thread, so both must use the instance from 
+        shared() for `lock` to keep their updates from overwriting
+        each other.
+        """
+
+    @classmethod
+    def shared(cls, directory: str = "saves") -> SaveCatalogue:
+        """
+        Returns the one catalogue of `directory` in this process,
+        creating and loading it on first use
+        """
+
+    def load(self) -> None:
+        """
+        Reads the catalogue file into `entries`
+
+        Notes
+        -----
+        Calls rebuild() if the file is missing or unreadable.
+        """
+
+    def update(self, file_name: str, header: SaveHeader, turns_played: int) -> None:
+        """
+        Adds or replaces the entry of a save and rewrites the 
+        catalogue
+
+        Notes
+        -----
+        Called by SaveCommand after the save itself is in place, so
+        the catalogue never names a save that does not exist.
+        """
+
+    def remove(self, file_name: str) -> None:
+        """
+        Drops the entry of a deleted save and rewrites the catalogue
+        """
+
+    def rebuild(self) -> None:
+        """
+        Recreates the catalogue from the headers of every save
+
+        Notes
+        -----
+        Reads only the header of each file with peek_save(). Used 
+        on first run and when the catalogue is out of date with the
+        directory's modification time.
+        """
+
+    def list(self,
+            sort_by: str = "modified",
+            descending: bool = True,
+            **filters
+            ) -> list[CatalogueEntry]:
+        """
+        Returns the entries matching `filters`, sorted
+
+        Parameters
+        ----------
+        sort_by : str
+            The CatalogueEntry or GameMetadata field to sort on
+        descending : bool
+            True to sort latest or largest first
+        filters
+            Field values an entry must equal, e.g. gamemode or 
+            total_players
+
+        Example
+        -------
+        >>> catalogue = SaveCatalogue()
+        >>> catalogue.load()
+        >>> catalogue.list(gamemode = GameMode.LOCAL_PLAY)[0].file_name
+        'SavedGame1'
+        """
+
+def peek_save(file_name: str) -> SaveHeader:
+    """
+    Reads the header of a save without reading its body
+
+    Parameters
+    ----------
+    file_name : str
+        The path of the save, or of a delta chain's manifest
+
+    Returns
+    -------
+    SaveHeader
+        The header, with the metadata of the game
+
+    Notes
+    -----
+    Reads HEADER_FORMAT.size bytes, then the rest of header_length.
+    For a delta chain, reads the header of the base named by the
+    manifest.
+    """
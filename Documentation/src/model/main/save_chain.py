@@ -0,0 +1,177 @@
+from __future__ import annotations
+from array import array
+from dataclasses import dataclass
+import struct
+
+class Game:
+    pass
+
+DELTA_MAGIC = b"RISKDLTA"
+DELTA_EXTENSION = ".delta"
+MANIFEST_EXTENSION = ".manifest"
+
+DELTA_HEADER_FORMAT = struct.Struct("<8sHIIHH")
+"""
+magic, schema_version, base_generation, turn, territory count, 
+card move count
+"""
+
+@dataclass
+class SaveDelta:
+    """
+    The changes to a game since the previous save of its chain
+
+    Attributes
+    ----------
+    turn : int
+        The turn the delta was taken at
+    territories : array[int]
+        The territory_ids whose owner or units changed
+    owners : array[int]
+        The new owner of each entry of `territories`
+    units : array[int]
+        The new units of each entry of `territories`
+    card_moves : array[int]
+        (card index, new holder) pairs, flattened. A holder of -1 
+        means the deck
+    deck_order : bytes
+        The deck section of the save format if the deck was 
+        reshuffled, else empty
+    players : bytes
+        The players section of the save format, so eliminations and
+        units_to_place changes from trades are kept
+    stats : bytes
+        The stats section of the save format, holding the new values
+        of GameStats and every PlayerStats including the float 
+        averages
+    player_queue : bytes
+        The player queue section of the save format
+    state : bytes
+        The state section of the save format
+
+    Notes
+    -----
+    Territory owners and units are stored as new values rather than
+    changes, so a delta applies the same way however many times a
+    territory changed during the turn. The players, stats, player 
+    queue and state sections are small and always included whole,
+    in the same encoding as the save format.
+    """
+
+    def encode(self) -> bytes:
+        """
+        Returns the delta as DELTA_HEADER_FORMAT followed by its arrays
+
+        Notes
+        -----
+        After the arrays, deck_order, players, stats, player_queue 
+        and state are each written as a uint32 length and their 
+        bytes.
+        """
+
+    @classmethod
+    def decode(cls, data: bytes) -> SaveDelta:
+        """
+        Parses a delta written by encode()
+        """
+
+    def apply(self, game: Game) -> None:
+        """
+        Applies the delta to a game restored from the previous save
+        """
+
+class SaveChain:
+    def __init__(self,
+                file_name: str,
+                max_deltas: int = 20,
+                max_delta_bytes: int = 65536
+                ):
+        """
+        A base snapshot plus a chain of per-turn deltas in `\saves`
+
+        Parameters
+        ----------
+        file_name : str
+            The name of the save
+        max_deltas : int
+            The number of deltas after which the chain is compacted
+        max_delta_bytes : int
+            The total size of the deltas after which the chain is
+            compacted
+
+        Attributes
+        ----------
+        file_name : str
+            The name of the save
+        max_deltas : int
+            The number of deltas after which the chain is compacted
+        max_delta_bytes : int
+            The total size of the deltas after which the chain is
+            compacted
+        generation : int
+            Incremented every time a new base is written
+        deltas : list[str]
+            The file names of the deltas of the current generation,
+            in order
+        delta_bytes : int
+            The total size of `deltas`
+        last_owners : array[int]
+            Board.owners as of the last save
+        last_units : array[int]
+            Board.units as of the last save
+
+        Notes
+        -----
+        Files of a chain:
+
+        file_name.<generation>.risk : the base, in the save format
+        file_name.<generation>.<n>.delta : the n-th delta
+        file_name.manifest : the generation and the list of deltas
+
+        Every file is written to a temporary name, fsynced and moved
+        into place with os.replace. The manifest is always written 
+        last, so it is the commit point: a crash leaves either the
+        old or the new manifest, and both only name complete files.
+        Files not named by the manifest are removed on the next save.
+        """
+
+    def save(self, game: Game) -> None:
+        """
+        Writes a delta, or a new base if the chain needs compacting
+
+        Parameters
+        ----------
+        game : Game
+            The game being saved
+
+        Notes
+        -----
+        Changed territories are found by comparing Board's arrays 
+        with last_owners and last_units, which costs one pass over 
+        the map. A new base is written instead of a delta on the 
+        first save, or when the delta would exceed max_deltas or 
+        max_delta_bytes.
+        """
+
+    def compact(self, game: Game) -> None:
+        """
+        Writes a fresh base of the next generation and drops the 
+        deltas of the previous one
+        """
+
+    @classmethod
+    def load(cls, file_name: str) -> Game:
+        """
+        Rebuilds the latest saved state of a chain
+
+        Parameters
+        ----------
+        file_name : str
+            The name of the save
+
+        Returns
+        -------
+        Game
+            The game after applying every delta of the manifest to
+            its base
+        """
@@ -0,0 +1,193 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from enum import IntEnum
+import struct
+
+class Game:
+    pass
+
+class GameMetadata:
+    pass
+
+class BlockCodec:
+    pass
+
+SAVE_MAGIC = b"RISKSAVE"
+SAVE_SCHEMA_VERSION = 2
+SAVE_EXTENSION = ".risk"
+
+HEADER_FORMAT = struct.Struct("<8sHHII")
+"""
+magic, schema_version, min_reader_version, header_length, flags
+"""
+
+METADATA_FORMAT = struct.Struct("<QdBB5BQ")
+"""
+game_id, timestamp (POSIX seconds), gamemode, total_players,
+the five GameRules fields, seed
+"""
+
+SECTION_FORMAT = struct.Struct("<HII")
+"""
+section_id, offset from the start of the file, length in bytes
+"""
+
+COMPRESSED_SECTION_FORMAT = struct.Struct("<HIIIB")
+"""
+section_id, offset from the start of the file, stored length,
+length before compression, codec_id. Used instead of 
+SECTION_FORMAT when FLAG_COMPRESSED_SECTIONS is set
+"""
+
+FLAG_COMPRESSED_SECTIONS = 0x1
+
+class SaveSection(IntEnum):
+    """
+    The sections of a save file body
+
+    Attributes
+    ----------
+    TERRITORIES
+        owners as int8[T] (-1 unowned) then units as uint16[T]
+    PLAYERS
+        Per player: player_id uint8, colour uint8, eliminated uint8,
+        units_to_place uint16, name as uint8 length + UTF-8 bytes
+    CARDS
+        The holder of every card as int8 (-1 for the deck)
+    DECK
+        The card indices of the deck from bottom to top as uint8
+    PLAYER_QUEUE
+        The player_ids of player_queue from front to back as uint8
+    STATS
+        GameStats then every PlayerStats, as fixed-width fields
+    STATE
+        The class of the current State as uint8 followed by
+        State.pack()
+    """
+    TERRITORIES = 1
+    PLAYERS = 2
+    CARDS = 3
+    DECK = 4
+    PLAYER_QUEUE = 5
+    STATS = 6
+    STATE = 7
+
+@dataclass
+class SaveHeader:
+    """
+    The fixed part at the start of every save
+
+    Attributes
+    ----------
+    schema_version : int
+        The version the file was written with
+    min_reader_version : int
+        The oldest reader able to load the file
+    metadata : GameMetadata
+        The metadata of the saved game
+    sections : dict[SaveSection, tuple[int, int, int, int]]
+        The offset, stored length, length before compression and 
+        codec_id of every section in the file. Without 
+        FLAG_COMPRESSED_SECTIONS both lengths are equal and codec_id
+        is 0(NullCodec)
+
+    Notes
+    -----
+    The header and section table sit at the start of the file and
+    are at most header_length bytes, so the metadata can be read
+    without touching the body.
+
+    Forward compatibility: readers skip section ids they do not 
+    know and use defaults for sections that are missing. A reader
+    refuses a file only if its own version is below 
+    min_reader_version. New fields are only ever appended to the 
+    end of a section, and readers ignore trailing bytes.
+    """
+
+def encode_game(game: Game, codec: BlockCodec = None) -> bytes:
+    """
+    Serialises a game into the save format
+
+    Parameters
+    ----------
+    game : Game
+        The game being saved
+    codec : BlockCodec
+        Compresses each section as its own block(None stores the 
+        sections as they are)
+
+    Returns
+    -------
+    bytes
+        The header, section table and sections
+
+    Notes
+    -----
+    Territory owners and units are copied straight from Board's 
+    arrays with array.tobytes(), so the cost is a handful of 
+    memory copies for the traditional map. Never uses pickle.
+
+    With a codec, FLAG_COMPRESSED_SECTIONS is set and 
+    min_reader_version is 2. The header and section table are never
+    compressed, so peek_save() and reading a single section stay
+    random access.
+    """
+
+def compress_sections(data: bytes, codec: BlockCodec) -> bytes:
+    """
+    Compresses the sections of a save written without a codec
+
+    Parameters
+    ----------
+    data : bytes
+        The output of encode_game(game)
+    codec : BlockCodec
+        The codec applied to each section
+
+    Returns
+    -------
+    bytes
+        The same bytes encode_game(game, codec) would have returned
+
+    Notes
+    -----
+    Lets a caller encode on one thread and compress on another,
+    as AutosaveService does.
+    """
+
+def decode_game(data: bytes) -> Game:
+    """
+    Rebuilds a game from the save format
+
+    Parameters
+    ----------
+    data : bytes
+        The content of a save file
+
+    Returns
+    -------
+    Game
+        The restored game
+
+    Notes
+    -----
+    Raises ValueError if the magic does not match or the file needs
+    a newer reader. Board arrays are filled with array.frombytes()
+    and the State is taken from the game's pool and restored with
+    State.unpack().
+    """
+
+def read_header(data: bytes) -> SaveHeader:
+    """
+    Parses the header and section table of a save
+
+    Parameters
+    ----------
+    data : bytes
+        At least the first header_length bytes of a save file
+
+    Returns
+    -------
+    SaveHeader
+        The parsed header
+    """
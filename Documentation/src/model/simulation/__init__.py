@@ -0,0 +1,3 @@
+from tournament import *
+from batched import *
+from win_probability import *
\ No newline at end of file
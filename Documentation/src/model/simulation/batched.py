@@ -0,0 +1,228 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Callable
+import numpy as np
+from ..main import Game, GameRules, ActionSpace
+
+class Board:
+    pass
+
+class BatchedGames:
+    def __init__(self,
+                board: Board,
+                rules: GameRules,
+                seeds: np.ndarray,
+                players: int = 4
+                ):
+        """
+        N independent games advanced in lockstep on NumPy arrays
+
+        Parameters
+        ----------
+        board : Board
+            The map, whose topology arrays are shared by every game
+        rules : GameRules
+            The rules of every game
+        seeds : np.ndarray
+            One seed per game. N is len(seeds)
+        players : int
+            The number of players per game
+
+        Attributes
+        ----------
+        owners : np.ndarray
+            (N, territories) int8, the owner of each territory
+        units : np.ndarray
+            (N, territories) int16, the units on each territory
+        cards : np.ndarray
+            (N, cards) int8, the holder of each card(-1 for the deck)
+        deck : np.ndarray
+            (N, cards) int8, the deck order of each game
+        phase : np.ndarray
+            (N,) uint8, the GamePhase of each game
+        current_player : np.ndarray
+            (N,) uint8
+        units_left : np.ndarray
+            (N,) int16, units to place or recruit
+        sub_state : np.ndarray
+            (N,) uint8, the AttackSubState of each game in the 
+            attack phase
+        unplaced_units : np.ndarray
+            (N,) int16, units from a trade in the attack phase still
+            to be placed
+        has_captured : np.ndarray
+            (N,) bool, True once the current player captured a 
+            territory this turn, for the end of turn card
+        front_from : np.ndarray
+            (N,) int16, the attacking territory of the front(-1 if
+            no front is focused on)
+        front_to : np.ndarray
+            (N,) int16, the defending territory of the front
+        attacker_dice : np.ndarray
+            (N,) uint8, the attacker's dice count on the front
+        defender_dice : np.ndarray
+            (N,) uint8, the defender's dice count on the front
+        loss_threshold : np.ndarray
+            (N,) int16, the loss threshold of the front
+        sets_traded : np.ndarray
+            (N,) int16, GameStats.traded_in_sets, which sets the 
+            value of the next trade
+        alive : np.ndarray
+            (N, players) bool
+        turns_played : np.ndarray
+            (N,) int32
+        winner : np.ndarray
+            (N,) int8, -1 while the game is running
+        adjacency : np.ndarray
+            (territories, territories) bool, from Board.adjacency
+        continent_matrix : np.ndarray
+            (continents, territories) bool, for continent bonuses
+        rng : np.random.Generator
+            Draws the dice of every game in one call
+
+        Notes
+        -----
+        Every step handles each phase with boolean masks over the
+        batch, so games in different phases advance in the same 
+        call. Finished games stay in the arrays and are masked out
+        until reset() refills them with new seeds.
+
+        Rules must match Game exactly, including dice comparison, 
+        continent bonuses, the card trade-in values and placement. 
+        cross_check() is the reference for that.
+
+        The front, dice, threshold, sub-state and has_captured 
+        arrays mirror AttackState and its OffensiveFront, so FOCUS,
+        CANCEL_FOCUS, ATTACK_*, ATTACKER_DICE, DEFENDER_DICE, 
+        TRANSFER and TRADE_SET follow the same rules as in Game. 
+        ActionKind only encodes actions, phase uses GamePhase.
+        """
+
+    def reset(self, games: np.ndarray, seeds: np.ndarray) -> None:
+        """
+        Starts new games in the given rows
+
+        Notes
+        -----
+        Automatic placement is vectorised by shuffling territory 
+        order per row with rng.permuted.
+        """
+
+    def legal_mask(self) -> np.ndarray:
+        """
+        Returns the (N, ActionSpace.size) legality mask of every game
+
+        Notes
+        -----
+        FOCUS pairs come from owners[:, edges] comparisons and 
+        units > 1 over the ActionSpace edge list, with no loop over
+        games.
+        """
+
+    def step(self, actions: np.ndarray, amounts: np.ndarray) -> None:
+        """
+        Applies one action per game
+
+        Parameters
+        ----------
+        actions : np.ndarray
+            (N,) action ids from the ActionSpace of `board`
+        amounts : np.ndarray
+            (N,) amounts for RECRUIT, TRANSFER and FORTIFY
+
+        Notes
+        -----
+        Illegal actions are replaced with NEXT_TURN. Games whose 
+        winner is set are skipped.
+        """
+
+    def _resolve_battles(self, games: np.ndarray, attacker_dice: np.ndarray, defender_dice: np.ndarray) -> None:
+        """
+        Rolls one round of battle in every game of `games`
+
+        Notes
+        -----
+        Draws an (n, 3) and an (n, 2) array of dice, masks dice 
+        beyond each game's count with zeros, sorts rows descending
+        and compares the first min(attacker_dice, defender_dice) 
+        columns. Losses are scattered back with np.add.at.
+        """
+
+    def _recruitment(self, games: np.ndarray) -> np.ndarray:
+        """
+        Returns the passive recruitment of the current player of 
+        each game in `games`
+
+        Notes
+        -----
+        Territory count // 3 (minimum 3) plus the bonus of every 
+        continent whose continent_matrix row is fully owned.
+        """
+
+    def _check_wins(self) -> None:
+        """
+        Updates `alive` and `winner` from `owners`
+
+        Notes
+        -----
+        Applies the WinConditionRules threshold to the per-player 
+        territory counts from np.bincount over offset owner ids.
+        """
+
+@dataclass
+class Mismatch:
+    """
+    A difference between BatchedGames and Game
+
+    Attributes
+    ----------
+    seed : int
+        The seed of the game
+    step : int
+        The number of actions applied before the difference
+    field : str
+        The first field that differs
+    batched : object
+        The value in BatchedGames
+    reference : object
+        The value in Game
+    """
+
+def cross_check(board: Board,
+                rules: GameRules,
+                seeds: np.ndarray,
+                policy: Callable[[np.ndarray, np.random.Generator], np.ndarray],
+                max_steps: int = 10000
+                ) -> list[Mismatch]:
+    """
+    Replays the same games through BatchedGames and Game and
+    compares them after every action
+
+    Parameters
+    ----------
+    board : Board
+        The map
+    rules : GameRules
+        The rules
+    seeds : np.ndarray
+        The seeds of the games
+    policy : Callable[[np.ndarray, np.random.Generator], np.ndarray]
+        Picks an action id for each row of a legality mask
+    max_steps : int
+        The number of actions per game before giving up
+
+    Returns
+    -------
+    list[Mismatch]
+        The first difference of every game that diverged(empty if 
+        the engines agree)
+
+    Notes
+    -----
+    Both engines must see the same randomness. Each Game is created
+    with its seed and its dice and draws are recorded from the 
+    emitted events, then fed to BatchedGames in place of `rng`. The
+    legality masks are compared as well as owners, units, cards, 
+    phase, sub-state, front, dice, loss threshold, unplaced units,
+    has_captured, current player and winner.
+    """
@@ -0,0 +1,168 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Iterator
+from ..main import Game, GameMetadata, GameRules, GameStats
+from ..data import PlayerStats
+from ..bots import Bot
+
+@dataclass(frozen=True)
+class TournamentConfig:
+    """
+    The games a tournament plays
+
+    Attributes
+    ----------
+    entrants : dict[str, type[Bot]]
+        The class of every bot version by name. Each seat's bot is
+        built from (seat, seed) in the worker
+    games : int
+        The total number of games
+    players_per_game : int
+        The number of seats per game
+    rule_variants : list[GameRules]
+        The rules cycled through, game i uses i % len(rule_variants)
+        (default is a single GameRules() with the default rules)
+    base_seed : int
+        Seed every game seed is derived from
+    rotate_seats : bool
+        If True, each seed is played players_per_game times with the
+        seat order rotated, so every entrant plays every seat on the
+        same dice
+    batch_size : int
+        The number of games a worker plays before sending results
+    workers : int
+        The number of worker processes(None uses os.cpu_count())
+    results_file : str
+        The append-only file results are written to, also used to
+        resume
+    """
+    entrants: dict[str, type[Bot]]
+    games: int
+    players_per_game: int = 4
+    rule_variants: list[GameRules] = field(default_factory=lambda: [GameRules()])
+    base_seed: int = 0
+    rotate_seats: bool = True
+    batch_size: int = 64
+    workers: int = None
+    results_file: str = "tournament.results"
+
+@dataclass
+class GameResult:
+    """
+    The outcome of one tournament game
+
+    Attributes
+    ----------
+    game_index : int
+        The position of the game in the tournament
+    seed : int
+        The seed of the game
+    seats : tuple[str, ...]
+        The entrant in each seat
+    winner : int
+        The seat of the winner(-1 if the game hit the turn limit)
+    turns_played : int
+        GameStats.turns_played at the end of the game
+    stats : GameStats
+        The stats of the game
+    player_stats : tuple[PlayerStats, ...]
+        The stats of each seat
+    """
+
+def game_seed(base_seed: int, game_index: int, players_per_game: int, rotate_seats: bool) -> int:
+    """
+    Returns the seed of a game
+
+    Notes
+    -----
+    Derived with hashlib.blake2b from base_seed and the seed group
+    (game_index // players_per_game when rotating seats, else 
+    game_index), so seeds are stable across runs, worker counts and
+    resumes.
+    """
+
+def play_batch(config: TournamentConfig, game_indices: range) -> bytes:
+    """
+    Plays a batch of games in a worker process
+
+    Parameters
+    ----------
+    config : TournamentConfig
+        The tournament being played
+    game_indices : range
+        The games to play
+
+    Returns
+    -------
+    bytes
+        The packed GameResult of every game
+
+    Notes
+    -----
+    Each game is created with Game.create_game from a GameMetadata 
+    with gamemode SIMULATION, its rule variant and game_seed(). Only
+    packed results cross the process boundary, as fixed-width 
+    structs, never Game objects.
+    """
+
+class TournamentRunner:
+    def __init__(self, config: TournamentConfig):
+        """
+        Plays a tournament across a ProcessPoolExecutor
+
+        Parameters
+        ----------
+        config : TournamentConfig
+            The tournament being played
+
+        Attributes
+        ----------
+        config : TournamentConfig
+            The tournament being played
+        completed : set[int]
+            The game indices already in results_file
+
+        Notes
+        -----
+        The games are split into batches of batch_size and at most
+        2 * workers batches are in flight, so memory stays bounded
+        however many games are played. Workers share nothing and 
+        send one message per batch, so throughput should scale 
+        close to linearly with the number of cores.
+        """
+
+    def resume(self) -> int:
+        """
+        Reads results_file and fills `completed`
+
+        Returns
+        -------
+        int
+            The number of games already played
+
+        Notes
+        -----
+        A batch is appended and fsynced as one record, so after a
+        crash the file ends in whole batches, plus at most a 
+        truncated record which is dropped.
+        """
+
+    def run(self) -> Iterator[GameResult]:
+        """
+        Plays every game not in `completed`
+
+        Yields
+        ------
+        GameResult
+            The result of each game, in completion order
+
+        Notes
+        -----
+        Appends each batch to results_file before yielding its 
+        results.
+        """
+
+    def standings(self) -> dict[str, tuple[int, int]]:
+        """
+        Returns the wins and games played of every entrant
+        """
@@ -0,0 +1,130 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Iterator
+from ..main import Game
+from ..bots import Bot
+
+@dataclass
+class WinEstimate:
+    """
+    The estimated chances of every player at some point of the run
+
+    Attributes
+    ----------
+    rollouts : int
+        The number of rollouts finished
+    probabilities : tuple[float, ...]
+        The share of rollouts won by each player
+    intervals : tuple[tuple[float, float], ...]
+        The Wilson score interval of each probability at the 
+        estimator's confidence
+    converged : bool
+        True once every interval is narrower than the tolerance
+    """
+
+def rollout_batch(snapshot: bytes, seeds: range, bots: tuple[type[Bot], ...], max_turns: int) -> bytes:
+    """
+    Plays rollouts from a position in a worker process
+
+    Parameters
+    ----------
+    snapshot : bytes
+        The position, from encode_game()
+    seeds : range
+        One rollout per seed
+    bots : tuple[type[Bot], ...]
+        The bot of each seat
+    max_turns : int
+        Rollouts still running after this many turns are won by the
+        player with the most territories
+
+    Returns
+    -------
+    bytes
+        The winning seat of every rollout, one byte each
+
+    Notes
+    -----
+    Each rollout starts from decode_game(snapshot), which costs 
+    microseconds, and runs with record_undo off, so no undo stack or
+    RNG copies are built. Undoing a rollout of up to `max_turns` 
+    turns would cost more than decoding again. The map topology and BattleOdds are attached from shared memory
+    by the pool initializer, not rebuilt in each worker.
+    """
+
+class WinProbabilityEstimator:
+    def __init__(self,
+                bots: tuple[type[Bot], ...] = None,
+                workers: int = None,
+                batch_size: int = 32,
+                confidence: float = 0.95,
+                tolerance: float = 0.02,
+                max_rollouts: int = 20000,
+                max_turns: int = 200
+                ):
+        """
+        Estimates P(each player wins) of a live position by rollouts
+
+        Parameters
+        ----------
+        bots : tuple[type[Bot], ...]
+            The bot of each seat in rollouts(None uses 
+            OddsAttackerBot in every seat)
+        workers : int
+            The number of processes(None uses os.cpu_count())
+        batch_size : int
+            The number of rollouts per task
+        confidence : float
+            The confidence of the reported intervals
+        tolerance : float
+            The interval width below which the run stops early
+        max_rollouts : int
+            The number of rollouts after which the run stops
+        max_turns : int
+            Passed to rollout_batch()
+
+        Attributes
+        ----------
+        pool : ProcessPoolExecutor
+            Created once and reused across estimates
+        topology : SharedMemory
+            Board's topology arrays for the map
+        odds : SharedMemory
+            BattleOdds.to_buffer()
+
+        Notes
+        -----
+        Shared memory blocks are created by the estimator and 
+        attached read-only by each worker's initializer, so 
+        rollouts share the immutable tables instead of pickling 
+        them per task.
+        """
+
+    def estimate(self, game: Game, seed: int = 0) -> Iterator[WinEstimate]:
+        """
+        Streams increasingly tight estimates for the current position
+
+        Parameters
+        ----------
+        game : Game
+            The live game. Only encode_game() is called on it, so the
+            game can keep running meanwhile
+        seed : int
+            The seed of the first rollout
+
+        Yields
+        ------
+        WinEstimate
+            A new estimate after every finished batch
+
+        Notes
+        -----
+        Keeps 2 * workers batches in flight. Stops once the estimate
+        has converged or max_rollouts is reached, and cancels the 
+        batches still queued.
+        """
+
+    def close(self) -> None:
+        """
+        Shuts down the pool and unlinks the shared memory
+        """
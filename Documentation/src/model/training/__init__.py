@@ -0,0 +1,4 @@
+from archive import *
+from environment import *
+from encoder import *
+from self_play import *
\ No newline at end of file
@@ -0,0 +1,227 @@
+from __future__ import annotations
+import numpy as np
+import struct
+
+class Game:
+    pass
+
+class Board:
+    pass
+
+ARCHIVE_MAGIC = b"RISKARCH"
+ARCHIVE_VERSION = 1
+ARCHIVE_EXTENSION = ".riskarch"
+
+ARCHIVE_HEADER_FORMAT = struct.Struct("<8sHHIIQ")
+"""
+magic, version, map (MapRules value), record_size, territories, 
+record count. Padded to ARCHIVE_HEADER_SIZE bytes
+"""
+ARCHIVE_HEADER_SIZE = 64
+
+def position_dtype(territories: int, cards: int) -> np.dtype:
+    """
+    Returns the fixed-stride record layout for a map
+
+    Parameters
+    ----------
+    territories : int
+        The number of territories on the map
+    cards : int
+        The number of cards in the deck
+
+    Returns
+    -------
+    np.dtype
+        A packed structured dtype with fields:
+
+        game_id : uint64
+        turn : uint32
+        player : uint8, the player to act
+        phase : uint8, the State class
+        owners : int8[territories]
+        units : uint16[territories]
+        cards : int8[cards], the holder of each card(-1 for the deck)
+        action : int32, the action id taken(-1 for snapshots)
+        amount : int16, the amount of the action
+        outcome : int8, the final placing of `player`(-1 until known)
+    """
+
+class PositionArchive:
+    def __init__(self, file_name: str, mode: str = "r"):
+        """
+        Many game positions packed into one file of fixed-stride records
+
+        Parameters
+        ----------
+        file_name : str
+            The path of the archive
+        mode : str
+            "r" to read, "r+" to append and back-fill outcomes
+
+        Attributes
+        ----------
+        file_name : str
+            The path of the archive
+        dtype : np.dtype
+            The record layout, from position_dtype()
+        records : np.memmap
+            Every record of the archive, mapped read-only in "r" mode
+        index : np.ndarray
+            Sorted (game_id, first record, record count) rows, read 
+            from the sidecar file_name + ".idx"
+
+        Notes
+        -----
+        The header is followed directly by the records, so record i 
+        starts at ARCHIVE_HEADER_SIZE + i * dtype.itemsize. Slicing 
+        `records` returns views into the page cache, no copy is 
+        made until the training code reads the fields.
+
+        Every game is appended whole by append_trajectory(), so the
+        records of a game are always contiguous, which game() and 
+        shard() rely on. Appending writes the records, updates the
+        record count in the header and remaps `records` only when 
+        the file had to grow. The file grows by at least an eighth 
+        of its size at a time, so remapping is amortised over many 
+        games and the header's record count marks the end of the 
+        valid records.
+        """
+
+    @classmethod
+    def create(cls, file_name: str, board: Board) -> PositionArchive:
+        """
+        Creates an empty archive for the map of `board`
+        """
+
+    def __len__(self) -> int:
+        """
+        Returns the number of records
+        """
+
+    def snapshot(self, game: Game, out: np.ndarray, action: int = -1, amount: int = 0) -> None:
+        """
+        Fills one record with the current position of `game`
+
+        Parameters
+        ----------
+        game : Game
+            The game being recorded
+        out : np.ndarray
+            A 0-d array of `dtype`, usually a row of the buffer later
+            passed to append_trajectory()
+        action : int
+            The action id taken from this position(-1 if none)
+        amount : int
+            The amount of the action
+
+        Notes
+        -----
+        Copies Board's owners and units arrays into the record with
+        np.frombuffer, without going through Territory objects. 
+        Nothing is written to the archive.
+        """
+
+    def append_trajectory(self, game_id: int, records: np.ndarray) -> int:
+        """
+        Appends every record of one game in a single write
+
+        Parameters
+        ----------
+        game_id : int
+            The game the records belong to, written into each record
+        records : np.ndarray
+            The records of the game in order, of `dtype`
+
+        Returns
+        -------
+        int
+            The index of the first appended record
+
+        Notes
+        -----
+        Adds one row to `index`. Raises ValueError if `game_id` is 
+        already in the archive, since its records would no longer 
+        be contiguous.
+        """
+
+    def set_outcomes(self, game_id: int, placings: np.ndarray) -> None:
+        """
+        Back-fills the outcome of every record of a game
+
+        Parameters
+        ----------
+        game_id : int
+            The game whose outcome is now known
+        placings : np.ndarray
+            The final placing of each player_id
+
+        Notes
+        -----
+        Writes placings[records["player"]] into the outcome field of
+        the game's slice, in place through the "r+" memmap.
+        """
+
+    def append_journal(self, journal_file: str) -> int:
+        """
+        Appends one record per command of a journal
+
+        Parameters
+        ----------
+        journal_file : str
+            A journal written by EventJournal
+
+        Returns
+        -------
+        int
+            The number of records appended
+
+        Notes
+        -----
+        Replays the journal with JournalReplayer and records the 
+        position before each command with snapshot(), the command 
+        encoded by ActionSpace.encode(). Outcomes are filled from 
+        the final position of the replay, and the game is written 
+        with append_trajectory().
+        """
+
+    def game(self, game_id: int) -> np.ndarray:
+        """
+        Returns the records of one game as a view
+
+        Notes
+        -----
+        Binary search over `index`, then a contiguous slice.
+        """
+
+    def sample(self, batch_size: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Returns `batch_size` random records
+
+        Notes
+        -----
+        Draws sorted random indices so the gather reads the file 
+        mostly forward. Unlike slicing, the gather copies.
+        """
+
+    def shard(self, shards: int, file_prefix: str) -> list[str]:
+        """
+        Splits the archive into `shards` archives by game_id
+
+        Parameters
+        ----------
+        shards : int
+            The number of output archives
+        file_prefix : str
+            Output files are file_prefix + "-<n>" + ARCHIVE_EXTENSION
+
+        Returns
+        -------
+        list[str]
+            The paths of the shards
+
+        Notes
+        -----
+        A game goes to shard game_id % shards, so all its records
+        stay together. Each game is copied as one slice.
+        """
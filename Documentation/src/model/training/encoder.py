@@ -0,0 +1,92 @@
+from __future__ import annotations
+import numpy as np
+from ..main import Game
+from .environment import ObservationLayout
+
+class ObservationEncoder:
+    def __init__(self, layout: ObservationLayout, players: int):
+        """
+        Keeps an observation tensor in sync with a game by rewriting
+        only what changed
+
+        Parameters
+        ----------
+        layout : ObservationLayout
+            Where each feature lives in the buffer
+        players : int
+            The number of players
+
+        Attributes
+        ----------
+        layout : ObservationLayout
+            Where each feature lives in the buffer
+        owner_view : np.ndarray
+            (territories, players) view of the owner slice
+        units_view : np.ndarray
+            (territories,) view of the units slice
+        continents_view : np.ndarray
+            (continents, players) view of the continents slice
+        last_player : int
+            The player the buffer was rotated for
+
+        Notes
+        -----
+        Views are created by bind() and write straight into the 
+        caller's buffer.
+        """
+
+    def bind(self, out: np.ndarray) -> None:
+        """
+        Points the views at a new observation buffer
+        """
+
+    def encode_full(self, game: Game, clear: bool = True) -> None:
+        """
+        Rebuilds the whole observation from the board arrays
+
+        Parameters
+        ----------
+        game : Game
+            The game being encoded
+        clear : bool
+            If True, calls Board.clear_dirty() so the next update() 
+            starts from a clean set
+
+        Notes
+        -----
+        Writes every slice of `layout`.
+        """
+
+    def update(self, game: Game) -> None:
+        """
+        Rewrites the rows of dirty territories and the global features
+
+        Parameters
+        ----------
+        game : Game
+            The game after one or more commands
+
+        Notes
+        -----
+        Takes Board.clear_dirty() and rewrites the owner and units 
+        rows of those ids only. Continent rows are rewritten only for
+        continents containing a dirty territory whose owner changed.
+        The cards, queue_position and phase slices are always 
+        rewritten, as they are a few values.
+
+        If the player to act differs from last_player, the owner 
+        one-hot is rotated, which touches every row, so encode_full()
+        is used instead.
+        """
+
+    def verify(self, game: Game) -> bool:
+        """
+        Returns True if the buffer equals a full rebuild
+
+        Notes
+        -----
+        Encodes into a scratch buffer with encode_full(game, 
+        clear=False), so `dirty` is left for the next update(), and
+        compares with np.array_equal. Used as the consistency check
+        of the incremental path in debug runs.
+        """
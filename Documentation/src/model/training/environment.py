@@ -0,0 +1,201 @@
+from __future__ import annotations
+from dataclasses import dataclass
+import numpy as np
+from ..main import Game, GameRules
+
+@dataclass
+class ObservationLayout:
+    """
+    Where each feature lives in the flat observation buffer
+
+    Attributes
+    ----------
+    owner : slice
+        (territories, players) one-hot of the owner of each 
+        territory, rotated so the player to act is column 0
+    units : slice
+        (territories,) units on each territory
+    continents : slice
+        (continents, players) one-hot of the owner of each fully
+        owned continent
+    cards : slice
+        (players,) number of cards held by each player
+    queue_position : slice
+        (players,) each player's position in player_queue relative
+        to the player to act, scaled to [0, 1](-1 if eliminated)
+    phase : slice
+        (phases,) one-hot of the current State class
+    size : int
+        The total length of the buffer
+
+    Notes
+    -----
+    Built once per map and number of players.
+    """
+
+class RiskEnv:
+    def __init__(self,
+                rules: GameRules,
+                players: int = 4,
+                max_turns: int = 500
+                ):
+        """
+        Gym-style environment around `Game` for GameMode.TRAINING
+
+        Parameters
+        ----------
+        rules : GameRules
+            The rules every episode is played with
+        players : int
+            The number of players. The agent acts for whoever's turn
+            it is
+        max_turns : int
+            Episodes are truncated after this many turns
+
+        Attributes
+        ----------
+        game : Game
+            The current episode
+        action_space : ActionSpace
+            The action encoding of the map
+        layout : ObservationLayout
+            The layout of `observation`
+        observation : np.ndarray
+            float32 buffer of layout.size, overwritten by every 
+            reset() and step()
+        mask : np.ndarray
+            uint8 buffer of action_space.size
+
+        Notes
+        -----
+        `observation` and `mask` are allocated once and handed out
+        as they are: the arrays returned by reset() and step() are
+        the same objects every time. Callers that keep observations
+        across steps must copy them.
+
+        Units are read through an np.frombuffer view of Board.units,
+        so updating the buffer is one vectorised copy with no 
+        Territory objects involved.
+        """
+
+    def reset(self, seed: int = None) -> tuple[np.ndarray, dict]:
+        """
+        Starts a new episode
+
+        Parameters
+        ----------
+        seed : int
+            The seed of the game(None draws one)
+
+        Returns
+        -------
+        tuple[np.ndarray, dict]
+            `observation` and an info dict with the player to act
+        """
+
+    def step(self, action_id: int, amount: int = None) -> tuple[np.ndarray, float, bool, bool, dict]:
+        """
+        Applies an action for the player to act
+
+        Parameters
+        ----------
+        action_id : int
+            An action id of `action_space`
+        amount : int
+            The number of units for actions that move units(None 
+            uses the maximum from legal_actions())
+
+        Returns
+        -------
+        tuple[np.ndarray, float, bool, bool, dict]
+            observation, reward, terminated, truncated, info
+
+        Notes
+        -----
+        The action is decoded with ActionSpace.decode() and passed to
+        Game.execute(). Reward is +1 to the winner and -1 to the 
+        others when a LastPlayerLeftEvent or the win condition ends 
+        the game, else 0, from the point of view of the player who 
+        acted. An illegal action raises ValueError.
+        """
+
+    def legal_action_mask(self) -> np.ndarray:
+        """
+        Returns `mask` filled from Game.legal_actions()
+        """
+
+    def _encode(self) -> None:
+        """
+        Rewrites `observation` in place from the board arrays
+
+        Notes
+        -----
+        Calls ObservationEncoder.update(), or encode_full() after
+        reset().
+        """
+
+class VectorRiskEnv:
+    def __init__(self,
+                rules: GameRules,
+                num_envs: int,
+                players: int = 4,
+                workers: int = None
+                ):
+        """
+        Many RiskEnv stepped in subprocesses through shared memory
+
+        Parameters
+        ----------
+        rules : GameRules
+            The rules every episode is played with
+        num_envs : int
+            The total number of environments
+        players : int
+            The number of players per game
+        workers : int
+            The number of subprocesses(None uses os.cpu_count()). 
+            Each runs num_envs / workers environments
+
+        Attributes
+        ----------
+        observations : np.ndarray
+            (num_envs, layout.size) float32 view of a SharedMemory 
+            block
+        masks : np.ndarray
+            (num_envs, action_space.size) uint8, shared
+        actions : np.ndarray
+            (num_envs, 2) int32, action id and amount, shared
+        rewards : np.ndarray
+            (num_envs,) float32, shared
+        dones : np.ndarray
+            (num_envs, 2) bool, terminated and truncated, shared
+
+        Notes
+        -----
+        Every array is a view of one multiprocessing.shared_memory 
+        block. Workers write their rows in place, so only a one byte
+        command and an acknowledgement cross each worker's Pipe per
+        step. Finished environments are reset automatically by the
+        worker, and the final observation is not kept.
+        """
+
+    def reset(self, seeds: np.ndarray = None) -> np.ndarray:
+        """
+        Resets every environment and returns `observations`
+        """
+
+    def step(self, actions: np.ndarray, amounts: np.ndarray = None) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Steps every environment once
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+            observations, rewards, terminated, truncated, all views
+            of the shared buffers
+        """
+
+    def close(self) -> None:
+        """
+        Stops the workers and unlinks the shared memory
+        """
@@ -0,0 +1,245 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Callable, Iterator
+import numpy as np
+from ..main import GameRules
+from .environment import RiskEnv
+
+Policy = Callable[[np.ndarray, np.ndarray, np.random.Generator], int]
+"""
+Picks an action id from (observation, legal mask, rng)
+"""
+
+PolicyFactory = Callable[[int], Policy]
+"""
+Builds the policy of a worker from its worker index. Must be a 
+module level callable so it can be pickled
+"""
+
+def play_episode(env: RiskEnv,
+                policy: Policy,
+                seed: int,
+                rng: np.random.Generator
+                ) -> Iterator[tuple[np.ndarray, int, np.ndarray, int]]:
+    """
+    Plays one game and yields every decision
+
+    Parameters
+    ----------
+    env : RiskEnv
+        The environment the game is played in
+    policy : Policy
+        Picks the action of every player
+    seed : int
+        The seed of the game
+    rng : np.random.Generator
+        Passed to the policy
+
+    Yields
+    ------
+    tuple[np.ndarray, int, np.ndarray, int]
+        observation, action id, legal mask and the player who acted.
+        The arrays are env's buffers, so consumers copy them before 
+        the next step
+
+    Returns
+    -------
+    np.ndarray
+        The final placing of every player, as the value of the 
+        StopIteration. Set from the LastPlayerLeftEvent or 
+        WinConditionRules result, or from territory counts if the 
+        game was truncated
+    """
+
+@dataclass
+class Shard:
+    """
+    A fixed-size block of samples
+
+    Attributes
+    ----------
+    shard_id : int
+        Unique across workers: worker index in the high bits
+    observations : np.ndarray
+        (shard_size, layout.size) float32
+    actions : np.ndarray
+        (shard_size,) int32
+    masks : np.ndarray
+        (shard_size, ceil(action_space.size / 8)) uint8, each legal
+        mask packed with np.packbits as its row is written
+    players : np.ndarray
+        (shard_size,) uint8
+    outcomes : np.ndarray
+        (shard_size,) int8, the final placing of the acting player
+        (-1 until back-filled)
+    rows : int
+        The number of rows filled
+    open_games : int
+        The number of games with rows in the shard that have not 
+        finished
+    """
+
+@dataclass
+class OutcomeFixup:
+    """
+    Outcome of rows already handed to the writer
+
+    Attributes
+    ----------
+    shard_id : int
+        The shard holding the rows
+    rows : np.ndarray
+        The row indices
+    outcomes : np.ndarray
+        The outcome of each row
+    """
+
+def self_play_worker(worker_index: int,
+                    rules: GameRules,
+                    policy_factory: PolicyFactory,
+                    seeds: range,
+                    shard_size: int,
+                    max_open_shards: int,
+                    output
+                    ) -> None:
+    """
+    Plays games and puts finished shards on `output`
+
+    Parameters
+    ----------
+    worker_index : int
+        The index of the worker
+    rules : GameRules
+        The rules of every game
+    policy_factory : PolicyFactory
+        Builds the worker's policy
+    seeds : range
+        The seeds of the games to play
+    shard_size : int
+        The number of rows per shard
+    max_open_shards : int
+        The number of full shards kept waiting for outcomes
+    output : multiprocessing.Queue
+        Bounded queue to the writer
+
+    Notes
+    -----
+    For each game the worker only remembers which rows of which 
+    shards it wrote, as (shard_id, start, stop) ranges. When the 
+    game ends, outcomes are written into the rows of shards still
+    in the worker. A full shard is put on `output` once open_games
+    reaches zero.
+
+    Legal masks are packed into `masks` with np.packbits(mask, 
+    out=row) as each row is written, so a shard never holds the 
+    unpacked masks, which would be eight times larger.
+
+    If more than max_open_shards full shards are waiting, the oldest
+    is sent anyway and the outcomes of its rows are sent later as an
+    OutcomeFixup, so memory stays bounded by long games.
+
+    `output` has a maxsize, so put() blocks when the writer falls
+    behind, which pauses the worker's games.
+    """
+
+class ShardWriter:
+    def __init__(self, directory: str):
+        """
+        Writes shards to disk and applies late outcomes
+
+        Parameters
+        ----------
+        directory : str
+            Where shard files are written
+
+        Attributes
+        ----------
+        directory : str
+            Where shard files are written
+        written : int
+            The number of shards written
+
+        Notes
+        -----
+        Each shard is written as "shard-<shard_id>.npz", holding 
+        observations, actions, masks and players, plus a sidecar 
+        "shard-<shard_id>.outcomes.npy" holding outcomes. Both are 
+        written to temporary names and renamed.
+
+        np.load(mmap_mode="r+") only maps plain .npy files, not 
+        .npz members, so outcomes are kept in their own file. A 
+        shard with unfilled outcomes gets its sidecar renamed to 
+        "shard-<shard_id>.outcomes.partial.npy"; apply() patches it
+        in place through np.load(mmap_mode="r+") and renames it 
+        once no outcome is -1.
+        """
+
+    def write(self, shard: Shard) -> None:
+        """
+        Writes a shard
+        """
+
+    def apply(self, fixup: OutcomeFixup) -> None:
+        """
+        Fills the outcomes of rows of a written shard
+
+        Notes
+        -----
+        Writes only the outcomes sidecar, the .npz is never 
+        rewritten.
+        """
+
+class SelfPlayPipeline:
+    def __init__(self,
+                rules: GameRules,
+                policy_factory: PolicyFactory,
+                directory: str,
+                workers: int = None,
+                shard_size: int = 65536,
+                max_open_shards: int = 2,
+                queue_size: int = 8
+                ):
+        """
+        Self-play data generation across worker processes
+
+        Parameters
+        ----------
+        rules : GameRules
+            The rules of every game
+        policy_factory : PolicyFactory
+            Builds each worker's policy
+        directory : str
+            Where shards are written
+        workers : int
+            The number of worker processes(None uses os.cpu_count() 
+            minus one for the writer)
+        shard_size : int
+            The number of rows per shard
+        max_open_shards : int
+            Passed to every worker
+        queue_size : int
+            The number of shards or fixups that can wait for the 
+            writer before workers block
+
+        Notes
+        -----
+        Peak memory is bounded by workers * (max_open_shards + 1) 
+        shards in workers plus queue_size in transit, whatever the 
+        number or length of games.
+        """
+
+    def run(self, games: int, base_seed: int = 0) -> int:
+        """
+        Plays `games` games and writes their shards
+
+        Returns
+        -------
+        int
+            The number of shards written
+
+        Notes
+        -----
+        Seeds are split into contiguous ranges, one per worker. The
+        writer runs in the calling process and stops once every 
+        worker has sent its final, partially filled shard.
+        """
@@ -3,3 +3,5 @@ from event_bus import *
 from game_enums import *
 from queue import *
 from stack import *
+from battle_odds import *
+from instrumentation import *
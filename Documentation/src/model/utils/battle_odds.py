@@ -0,0 +1,114 @@
+from __future__ import annotations
+import numpy as np
+
+class BattleOdds:
+    def __init__(self, max_attackers: int = 60, max_defenders: int = 60):
+        """
+        Precomputed probabilities of every battle
+
+        Parameters
+        ----------
+        max_attackers : int
+            The largest attacking stack tabulated
+        max_defenders : int
+            The largest defending stack tabulated
+
+        Attributes
+        ----------
+        round_outcomes : np.ndarray
+            (4, 3, 3, 3) float64. round_outcomes[a, d, x, y] is the 
+            probability that one round with a attacker dice and d 
+            defender dice costs the attacker x and the defender y 
+            units. Exact, by enumerating the 6 ** (a + d) rolls
+        capture : np.ndarray
+            (max_attackers + 1, max_defenders + 1) float64. The 
+            probability of capturing when attacking with maximum dice
+            until capture or one unit is left
+        final_distribution : np.ndarray
+            (max_attackers + 1, max_defenders + 1, max_attackers + 1,
+            max_defenders + 1) float32, lazily built. The probability 
+            of each final (attackers, defenders) of that battle. Only
+            covers maximum dice without a loss threshold, use 
+            battle_distribution() for a given front
+        battle_cache : dict[tuple[int, int, int, int, int], tuple[tuple[int, int, float], ...]]
+            The results of battle_distribution() by (attackers, 
+            defenders, loss_threshold, attacker_dice, defender_dice)
+
+        Notes
+        -----
+        `capture` and `final_distribution` are filled by dynamic 
+        programming over (attackers, defenders) from round_outcomes,
+        in increasing order of attackers + defenders. Stacks above 
+        the table are clipped to its edge, which overestimates the 
+        odds of very large defences slightly.
+
+        The tables only depend on the dice rules, so one instance is
+        built per process with shared() and reused. battle_cache is
+        kept per instance and is not part of to_buffer().
+        """
+
+    @classmethod
+    def shared(cls) -> BattleOdds:
+        """
+        Returns the instance for the process, building it on first
+        use
+        """
+
+    def round_distribution(self, attacker_dice: int, defender_dice: int) -> list[tuple[int, int, float]]:
+        """
+        Returns the (attacker losses, defender losses, probability)
+        outcomes of one round with non-zero probability
+        """
+
+    def battle_distribution(self,
+                attackers: int,
+                defenders: int,
+                loss_threshold: int = 0,
+                attacker_dice: int = 3,
+                defender_dice: int = 2
+                ) -> tuple[tuple[int, int, float], ...]:
+        """
+        Returns the (attacker losses, defender losses, probability)
+        outcomes with non-zero probability of a simulated battle on
+        one front
+
+        Parameters
+        ----------
+        attackers : int
+            The units on the attacking territory
+        defenders : int
+            The units on the defending territory
+        loss_threshold : int
+            The front's loss threshold
+        attacker_dice : int
+            The front's attacker dice
+        defender_dice : int
+            The front's defender dice
+
+        Notes
+        -----
+        Follows AttackSimulateCommand.execute(): each round uses 
+        min(attacker_dice, attackers - 1) and min(defender_dice, 
+        defenders) dice, and the battle stops when the defenders 
+        reach zero, the attackers reach one or the attackers are at
+        or below loss_threshold.
+
+        Computed by pushing probability forward through 
+        round_distribution() from (attackers, defenders), visiting 
+        only reachable stacks, so a call costs 
+        O(attackers * defenders) and stacks are never clipped. 
+        Results are memoized in `battle_cache`, since a search meets
+        the same fronts many times.
+        """
+
+    def to_buffer(self) -> bytes:
+        """
+        Returns the tables as one contiguous buffer, for shared 
+        memory
+        """
+
+    @classmethod
+    def from_buffer(cls, buffer: memoryview) -> BattleOdds:
+        """
+        Wraps a buffer from to_buffer() without copying it
+        """
@@ -1,17 +1,51 @@
 from .templates.event import *
+from .game_enums import SubscriberDispatch
+from dataclasses import dataclass
+import threading
 
 class EventBus:
-    def __init__(self):
+    def __init__(self, max_workers: int = 4):
         """
         Manages the flow of data from intenal to external components.
 
+        Parameters
+        ----------
+        max_workers : int
+            The size of the thread pool used for THREADED subscribers
+
         Attributes
         ----------
         subscribers : dict
             The dictionary of subscribers and their events
+        muted : bool
+            If True, emit() returns immediately without calling
+            any subscriber. Used when replaying a journal
+        executor : ThreadPoolExecutor
+            Bounded pool running THREADED subscribers. Created
+            lazily on the first THREADED subscription
+        workers : dict[callable, SubscriberWorker]
+            The worker of every THREADED subscriber
+        opt_in : bool
+            If True, events without a subscriber are not built. Set
+            from the game's EngineProfile(emit_events = False)
+        instrumentation : Instrumentation
+            If set, emit() adds its duration to 
+            instrumentation.emit_ns when called on the game thread
+            (None by default)
+        game_thread : int
+            threading.get_ident() of the game thread, recorded when
+            the bus is created and again by bind_game_thread()
+        deferred : queue.SimpleQueue[Event]
+            Events emitted off the game thread, including the 
+            SubscriberErrorEvents of THREADED subscribers, waiting 
+            to be delivered on the game thread
         """
     
-    def subscribe(self, event: Event, subscriber: callable) -> None:
+    def subscribe(self, 
+                event: Event, 
+                subscriber: callable,
+                dispatch: SubscriberDispatch = SubscriberDispatch.INLINE
+                ) -> None:
         """
         Maps a subscriber to an event occuring. 
 
@@ -22,6 +56,14 @@ class EventBus:
         event : Event
             A significant occurance in Game that external
             components need to know about.
+        dispatch : SubscriberDispatch
+            INLINE for in-memory listeners, THREADED for
+            listeners that block
+
+        Notes
+        -----
+        A THREADED subscriber gets its own SubscriberWorker, shared
+        across every event it is subscribed to.
         """
 
 
@@ -33,4 +75,161 @@ class EventBus:
         ----------
         event : Event
             The event that occured
+
+        Notes
+        -----
+        INLINE subscribers are called directly, in subscription
+        order. THREADED subscribers only have the event put on
+        their worker's queue, so emit() never waits on them.
+
+        Compares threading.get_ident() with `game_thread`. Off the
+        game thread, the event is put on `deferred` and emit() 
+        returns, so INLINE subscribers only ever run on the game 
+        thread. On the game thread, calls deliver_deferred() first.
+        """
+
+    @property
+    def queue_depths(self) -> dict[callable, int]:
+        """
+        Returns the number of events waiting for each
+        THREADED subscriber
+        """
+
+    def wants(self, event_type: type[Event]) -> bool:
+        """
+        Returns True if building an event of `event_type` is worth it
+
+        Parameters
+        ----------
+        event_type : type[Event]
+            The class of the event about to be emitted
+
+        Notes
+        -----
+        Always True unless `opt_in` is set, in which case it is 
+        True only if `event_type` or one of its bases has a 
+        subscriber. The answer is cached per 
+        type and cleared on subscribe().
+        """
+
+    def bind_game_thread(self) -> None:
+        """
+        Records the calling thread as `game_thread`
+
+        Notes
+        -----
+        Called by Game when it attaches to the bus, so a bus built
+        on one thread can be handed to a game played on another.
+        """
+        self.game_thread = threading.get_ident()
+
+    def deliver_deferred(self) -> None:
+        """
+        Emits every event waiting on `deferred`, in the order they 
+        were deferred
+
+        Notes
+        -----
+        Called by emit() and by Game.execute() after each command.
+        Asserts that the caller is `game_thread`, so INLINE 
+        subscribers are never called from the thread pool or the
+        autosave writer. Empties `deferred` with get_nowait() until
+        queue.Empty.
+        """
+        assert threading.get_ident() == self.game_thread, \
+            "deliver_deferred() called off the game thread"
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the thread pool
+
+        Parameters
+        ----------
+        wait : bool
+            If True, block until every queued event was delivered
+        """
+
+class SubscriberWorker:
+    def __init__(self, subscriber: callable, event_bus: EventBus):
         """
+        Delivers events to one THREADED subscriber in order
+
+        Parameters
+        ----------
+        subscriber : callable
+            The blocking subscriber
+        event_bus : EventBus
+            The event bus owning the worker
+
+        Attributes
+        ----------
+        subscriber : callable
+            The blocking subscriber
+        pending : collections.deque[Event]
+            The events not yet delivered to the subscriber
+        running : bool
+            True while a drain task is scheduled on the executor
+        lock : threading.Lock
+            Guards `pending` and `running`
+
+        Notes
+        -----
+        At most one drain task per worker is on the executor at a
+        time, which keeps the events of a subscriber in emission
+        order while different subscribers run in parallel.
+
+        `pending` and `running` are read and written by the game 
+        thread in submit() and by the executor in _drain(), so both
+        are only touched while holding `lock`. The subscriber itself
+        is called outside the lock.
+        """
+
+    def submit(self, event: Event) -> None:
+        """
+        Queues an event and schedules a drain if none is running
+
+        Parameters
+        ----------
+        event : Event
+            The event being delivered
+
+        Notes
+        -----
+        Under `lock`, appends the event and, if `running` is False,
+        sets it and schedules _drain() on the executor.
+        """
+
+    def _drain(self) -> None:
+        """
+        Calls the subscriber for every pending event
+
+        Notes
+        -----
+        Runs on the executor. Each event is popped under `lock`.
+        When `pending` is empty, `running` is cleared under the same
+        lock before returning, so an event submitted meanwhile 
+        either is popped by this drain or schedules a new one and is
+        never stranded.
+
+        If the subscriber raises, the exception is wrapped in a 
+        SubscriberErrorEvent and emitted, which defers it to the 
+        game thread, where deliver_deferred() hands it to INLINE 
+        subscribers. The remaining events are still delivered.
+        SubscriberErrorEvent is never sent to the worker that raised
+        it.
+        """
+
+@dataclass
+class SubscriberErrorEvent(ImplicitEvent):
+    """
+    Event emitted when a THREADED subscriber raises
+
+    Attributes
+    ----------
+    subscriber : callable
+        The subscriber that raised
+    event : Event
+        The event being delivered
+    error : Exception
+        The exception raised
+    """
@@ -14,6 +14,19 @@ class GameMode(Enum):
         Simulation
     """
 
+class SubscriberDispatch(Enum):
+    """
+    Where the EventBus runs a subscriber
+
+    Attributes
+    ----------
+    INLINE
+        Called directly on the game thread inside emit()
+    THREADED
+        Called on the EventBus thread pool, for subscribers
+        that block (disk, sockets, rendering)
+    """
+
 class PlayerColour(Enum):
     """
     The list of colours that can represent
@@ -115,6 +128,88 @@ class BattleStatus(Enum):
         Failsafe if front was abandoned 
     """
 
+class AttackSubState(Enum):
+    """
+    The sub-states of the attack phase, used to 
+    pick the whitelist of AttackState
+
+    Attributes
+    ----------
+    FREE
+        No transfer, trade or placement is pending
+    EXPECTING_TRANSFER
+        A territory was just captured and units must be
+        moved into it
+    EXPECTING_TRADE
+        The player holds too many cards and must trade in a set
+    EXPECTING_PLACEMENT
+        The player has unplaced units from a trade
+    """
+
+class GamePhase(Enum):
+    """
+    The phase of a game, for engines that store it as an integer
+    instead of a State object
+
+    Attributes
+    ----------
+    PLACEMENT
+        PlacementState
+    RECRUITMENT
+        RecruitmentState
+    ATTACK
+        AttackState
+    FORTIFICATION
+        FortificationState
+    END
+        EndState
+    """
+
+class ActionKind(Enum):
+    """
+    The families of actions in the integer action encoding
+
+    Attributes
+    ----------
+    PLACE
+        Place a unit in the placement phase
+    RECRUIT
+        Recruit units onto a territory
+    FOCUS
+        Focus an offensive between two territories
+    CANCEL_FOCUS
+        Cancel the current offensive
+    ATTACK_MANUAL
+        Roll one round of battle
+    ATTACK_SIMULATE
+        Simulate the battle until it stops
+    ATTACKER_DICE
+        Change the attacker's dice count
+    DEFENDER_DICE
+        Change the defender's dice count
+    TRANSFER
+        Move units into a captured territory
+    FORTIFY
+        Move units between two friendly territories
+    TRADE_SET
+        Trade in three cards
+    NEXT_TURN
+        End the current phase
+    """
+
+class SaveMode(Enum):
+    """
+    How SaveCommand writes the game
+
+    Attributes
+    ----------
+    FULL
+        A complete snapshot
+    DELTA
+        A delta against the previous save of the same name,
+        compacted into a new snapshot when the chain grows
+    """
+
 class PlacementRules(Enum):
     """
     Attributes
@@ -1,3 +1,4 @@
 from command import *
+from delta import *
 from event import *
 from state import *
\ No newline at end of file
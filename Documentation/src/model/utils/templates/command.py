@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from __future__ import annotations
 from event import ExplicitEvent
+from delta import CommandDelta
 
 class Game:
     pass
@@ -29,6 +30,12 @@ class Command(ABC):
 
         A base command means it will pass any check, for a 
         phase-specific commands use subclasses
+
+        Attributes
+        ----------
+        delta : CommandDelta
+            The changes made by execute()(None until executed, or
+            if the game is not recording undo history)
         """
         pass
     
@@ -52,6 +59,11 @@ class Command(ABC):
         The rule must be validated using _validate() before executing, 
         the return of None from _validate() assumes that no failure in 
         operation.
+
+        If `game` is recording undo history, every mutation goes 
+        through Board, Player and State methods that append to 
+        `delta`, and `delta` is pushed onto game's undo stack 
+        afterwards. Meta commands (Save, Load) record nothing.
         """   
         pass
 
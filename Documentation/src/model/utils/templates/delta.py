@@ -0,0 +1,121 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+
+class Game:
+    pass
+
+@dataclass
+class CommandDelta:
+    """
+    Compact record of everything a `Command` changed in `Game`,
+    used to undo and redo it.
+
+    Attributes
+    ----------
+    unit_changes : list[tuple[int, int]]
+        (territory_id, change in units) for every territory touched
+    owner_changes : list[tuple[int, int, int]]
+        (territory_id, old player_id, new player_id) for every 
+        territory that changed owner
+    card_moves : list[tuple[int, int, int]]
+        (card index, old holder, new holder) for every card moved.
+        A holder is a player_id, or -1 for the deck
+    counter_changes : list[tuple[int, str, int | float, int | float]]
+        (player_id, name, old value, new value) for counters outside
+        the board, such as units_to_place, the GameStats fields and
+        every PlayerStats field including the float averages. 
+        player_id is -1 for counters that belong to no player
+    queue_before : tuple[tuple[int, ...], tuple[int, ...]]
+        The player_ids of player_queue and eliminated_players before
+        the command(None if neither changed)
+    queue_after : tuple[tuple[int, ...], tuple[int, ...]]
+        The player_ids of player_queue and eliminated_players after
+        the command(None if neither changed)
+    rng_before : tuple[int, int]
+        (data.rng_seed, data.rng_draws), the position of the game's
+        RNG before the command
+    rng_after : tuple[int, int]
+        The position of the game's RNG after the command, equal to
+        rng_before if the command drew nothing
+    state_before : bytes
+        The packed State before the command(None if the State's 
+        ephemeral data did not change)
+    state_after : bytes
+        The packed State after the command(None if the State's
+        ephemeral data did not change)
+    battle_outcome : tuple[int, int]
+        The (attacker losses, defender losses) given to an attack
+        command instead of rolling(None if the dice were rolled)
+
+    Notes
+    -----
+    Every field is written by Board, Player and State as the command
+    mutates them, never by diffing the whole game. Undoing applies
+    the changes in reverse order with their sign flipped, redoing 
+    applies them forward, so both are O(size of the change).
+
+    Counters store old and new values rather than a difference, so
+    undo and redo assign them and floats are restored exactly. The
+    queues are at most six ids each, so an elimination or a change
+    of turn order stores them whole.
+
+    The RNG is stored as a position rather than random.getstate(),
+    which is 625 ints. Every draw goes through Game.random_below(),
+    so the seed of the turn and the number of draws since identify
+    the RNG state, and Game.seek_rng() restores it.
+    """
+    unit_changes: list[tuple[int, int]] = field(default_factory=list)
+    owner_changes: list[tuple[int, int, int]] = field(default_factory=list)
+    card_moves: list[tuple[int, int, int]] = field(default_factory=list)
+    counter_changes: list[tuple[int, str, int | float, int | float]] = field(default_factory=list)
+    queue_before: tuple[tuple[int, ...], tuple[int, ...]] = None
+    queue_after: tuple[tuple[int, ...], tuple[int, ...]] = None
+    rng_before: tuple[int, int] = None
+    rng_after: tuple[int, int] = None
+    state_before: bytes = None
+    state_after: bytes = None
+    battle_outcome: tuple[int, int] = None
+
+    def revert(self, game: Game) -> None:
+        """
+        Restores `game` to how it was before the command
+
+        Parameters
+        ----------
+        game : Game
+            The game the command was executed on
+
+        Notes
+        -----
+        Does not emit any events. If the command changed the 
+        State class, the pooled instance of the previous class is
+        restored from state_before.
+
+        Runs with game.record_undo cleared, so nothing is recorded
+        while reverting. Units and owners are written through 
+        Board.set_units() and Board.set_owner() and card holders 
+        through Deck.move_card(), the methods that maintain 
+        Board.zobrist, Board.dirty and Deck.card_zobrist, so 
+        position_hash and incremental observers match the restored
+        position. If rng_after differs from rng_before, the RNG is
+        restored with Game.seek_rng(*rng_before).
+        """
+
+    def apply(self, game: Game) -> None:
+        """
+        Replays the command's changes onto `game`
+
+        Parameters
+        ----------
+        game : Game
+            The game the command was undone on
+
+        Notes
+        -----
+        Does not call Command.execute(), so no dice are rolled. 
+        Changes are written through the same Board and Deck methods
+        as revert(), with game.record_undo cleared. If rng_after 
+        differs from rng_before, the RNG is moved with 
+        Game.seek_rng(*rng_after). They are equal when 
+        battle_outcome is set.
+        """
@@ -2,10 +2,38 @@ from abc import ABC, abstractmethod
 from __future__ import annotations
 from command import Command
 from event import ExplicitEvent
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Iterable
 
 class Game:
     pass
 
+NOT_ALLOWED_NOW = "NOT_ALLOWED_NOW"
+"""
+Error code returned by State._validate() for a command the State 
+does not route, when EngineProfile.format_messages is False
+"""
+
+class LegalActions:
+    pass
+
+@dataclass(frozen=True)
+class CommandRoute:
+    """
+    Entry of a State's dispatch table
+
+    Attributes
+    ----------
+    validator : Callable[[State, Command], str]
+        State-level checks for the command(None assumes valid)
+    handler : Callable[[State, ExplicitEvent], None]
+        Side effects specific to the command, called
+        after Command.execute()
+    """
+    validator: Callable
+    handler: Callable
+
 class State(ABC):
     """
     Abstract class to represent all `Game` states.
@@ -28,8 +56,26 @@ class State(ABC):
 
     Responsible for emitting `Event`s to objects external to 
     `Game`.
+
+    Command routing is table driven. Each subclass builds its 
+    `dispatch_table` and `sub_state_whitelists` once, when the 
+    class is created, so routing a command is a dict lookup 
+    rather than a chain of isinstance checks.
     
     """
+    dispatch_table: dict[type[Command], CommandRoute] = {}
+    sub_state_whitelists: dict[Enum, frozenset[type[Command]]] = {}
+    whitelisted_commands: frozenset[type[Command]] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Builds the dispatch table of a State subclass once per class
+        """
+        super().__init_subclass__(**kwargs)
+        cls.dispatch_table = cls._build_dispatch_table()
+        cls.sub_state_whitelists = cls._build_sub_state_whitelists()
+        cls.whitelisted_commands = frozenset(cls.dispatch_table)
+
     def __init__(self):
         """
         Constructor for State
@@ -47,11 +93,112 @@ class State(ABC):
         captured a territory before the end of their turn,
         so we would need an extra boolean attribute which
         exists only for State's lifecycle. 
+
+        in_batch : bool
+            True while execute_many() is running
+
+        The whitelist is a class attribute built by
+        `__init_subclass__` and is not rebuilt per instance.
+
+        Instances are pooled by `Game` and reused across turns, so
+        ephemeral data must be (re)initialised in `reset()` rather
+        than only in the constructor.
         """
         self.game: Game
-        self.whitelisted_commands: set[type[Command]]
 
-    @abstractmethod
+    def reset(self) -> None:
+        """
+        Restores the ephemeral data of State in place
+
+        Notes
+        -----
+        Called by `Game` every time a pooled State is re-entered,
+        before `on_enter()`. Must not allocate new containers when
+        existing ones can be cleared.
+        """
+        pass
+
+    @classmethod
+    def _build_dispatch_table(cls) -> dict[type[Command], CommandRoute]:
+        """
+        Returns the map of every whitelisted command type 
+        to its validator and handler
+
+        Notes
+        -----
+        Called once per subclass. Keyed on the exact command
+        type, so subclasses of a command must be listed
+        explicitly.
+
+        The base table routes the commands accepted in every
+        phase:
+
+        SaveCommand : _validate_save, _on_save
+        LoadCommand : _validate_load, _on_load
+
+        Subclasses extend the table returned by
+        super()._build_dispatch_table() rather than repeating
+        these routes.
+        """
+        from ...data.commands import SaveCommand, LoadCommand
+        return {
+            SaveCommand: CommandRoute(cls._validate_save, cls._on_save),
+            LoadCommand: CommandRoute(cls._validate_load, cls._on_load),
+        }
+
+    @classmethod
+    def _build_sub_state_whitelists(cls) -> dict[Enum, frozenset[type[Command]]]:
+        """
+        Returns the commands allowed in each sub-state
+
+        Notes
+        -----
+        A sub-state missing from the map allows every command
+        in `dispatch_table`.
+        """
+        return {}
+
+    @property
+    def sub_state(self) -> Enum:
+        """
+        Returns the current sub-state of State(None if State
+        has no sub-states)
+        """
+        return None
+
+    def _route(self, command: Command) -> CommandRoute:
+        """
+        Returns the route of `command`(None if it is not
+        accepted in the current sub-state)
+        """
+        route = self.dispatch_table.get(type(command))
+        if route is None:
+            return None
+        allowed = self.sub_state_whitelists.get(self.sub_state)
+        if allowed is not None and type(command) not in allowed:
+            return None
+        return route
+
+    def _validate_save(self, command: Command) -> str:
+        """
+        Validator of SaveCommand(None assumes valid)
+        """
+
+    def _on_save(self, result: ExplicitEvent) -> None:
+        """
+        Handler of SaveEvent
+        """
+
+    def _validate_load(self, command: Command) -> str:
+        """
+        Validator of LoadCommand(None assumes valid)
+        """
+
+    def _on_load(self, result: ExplicitEvent) -> None:
+        """
+        Handler of LoadEvent
+        """
+
     def execute(self, command: Command) -> None:
         """
         Method to validate and execute Commands
@@ -62,11 +209,149 @@ class State(ABC):
         Notes
         -----
         Returns None, mutates `Game` as a side effect.
+
+        The route of `command` is resolved once with _route() and 
+        passed to _validate(), then its handler runs after 
+        Command.execute(). A command with no route in the current 
+        sub-state, or that fails _validate(), is not executed, and 
+        a FailedCommandEvent carrying the error is emitted instead.
+
+        If game's instrumentation is set, the timed path in
+        Instrumentation.execute() runs instead.
         """
-        if self._validate(command):
-            result = command.execute(self.game)
+        instrumentation = self.game.instrumentation
+        if instrumentation is not None:
+            instrumentation.execute(self, command)
+            return
+        route = self._route(command)
+        if route is None:
+            self._reject(command, self._not_allowed(command))
+            return
+        error = self._validate(command, route)
+        if error is not None:
+            self._reject(command, error)
+            return
+        result = command.execute(self.game)
+        route.handler(self, result)
         self._on_execute(result)
 
+    def _reject(self, command: Command, error: str) -> ExplicitEvent:
+        """
+        Emits and returns the FailedCommandEvent of a command
+        that failed _validate()
+
+        Parameters
+        ----------
+        command : Command
+            The rejected command
+        error : str
+            The error returned by _validate()
+        """
+        from ...data.commands import FailedCommandEvent
+        event = FailedCommandEvent(error=error, command=command)
+        self.game.event_bus.emit(event)
+        return event
+
+    def execute_many(self, commands: Iterable[Command]) -> list[ExplicitEvent]:
+        """
+        Method to validate and execute a sequence of Commands
+
+        Parameters
+        ----------
+        commands : Iterable[Command]
+            The commands being executed, in order
+
+        Returns
+        -------
+        list[ExplicitEvent]
+            One result per command consumed. A command that fails
+            validation gets the FailedCommandEvent from _reject()
+            and does not stop the batch
+
+        Notes
+        -----
+        Sets `in_batch` for the duration of the call. Each command
+        goes through _validate() and its handler in `dispatch_table`
+        as in execute(), but _on_execute() only runs for results 
+        for which _must_transition() is True. _on_batch_end() runs 
+        once after the last command.
+
+        Validation reads the current player, sub-state and counters 
+        once and updates them as handlers run, instead of looking 
+        them up through `game` for every command.
+
+        If a command moves `game` to another State, the remaining 
+        commands are forwarded to that State's execute_many().
+        """
+
+    def pack(self) -> bytes:
+        """
+        Serialises the ephemeral data of State
+
+        Returns
+        -------
+        bytes
+            Fixed-width fields, players and territories as ids
+
+        Notes
+        -----
+        Used by save files and undo deltas. The default packs 
+        nothing.
+        """
+        return b""
+
+    def unpack(self, data: bytes) -> None:
+        """
+        Restores the ephemeral data of State in place from pack()
+
+        Parameters
+        ----------
+        data : bytes
+            The output of pack()
+        """
+        pass
+
+    def legal_actions(self) -> LegalActions:
+        """
+        Enumerates every legal action of the current player
+
+        Returns
+        -------
+        LegalActions
+            The integer encoded actions, their maximum amounts and
+            the mask over game's ActionSpace
+
+        Notes
+        -----
+        Reads the compact arrays of Board directly and never builds
+        a Command. Only actions allowed by the current sub-state's
+        whitelist are included. The default is no legal actions.
+        """
+        pass
+
+    def _must_transition(self, result: ExplicitEvent) -> bool:
+        """
+        Returns True if `result` needs _on_execute() immediately
+        during a batch
+
+        Notes
+        -----
+        By default every result does. States override this to defer
+        checks that can safely run once at the end of the batch.
+        """
+        return True
+
+    def _on_batch_end(self) -> None:
+        """
+        Runs the checks deferred during execute_many()
+
+        Notes
+        -----
+        Clears `in_batch` and runs the phase transition checks of 
+        _on_execute() once against the final state of `game`.
+        """
+        pass
+
     @abstractmethod
     def _on_execute(self, result: ExplicitEvent) -> None:
         """
@@ -78,11 +363,16 @@ class State(ABC):
         `CommandResult` from `execute()` and checks if Game
         needs to be edited more than by the atomic level by 
         `Command`. Also emits any `Events` as a side effect.
+
+        Side effects specific to one command belong in its
+        handler in `dispatch_table`. `_on_execute` only holds
+        the checks shared by every command, such as phase 
+        transitions.
         """
         pass
 
     @abstractmethod
-    def _validate(self, command: Command) -> bool:
+    def _validate(self, command: Command, route: CommandRoute = None) -> str:
         """
         Method to check if `Command` is legal within 
         the game rules by checking against whitelist
@@ -94,12 +384,32 @@ class State(ABC):
             The `Game` instance being executed on
         command : Command
             The request attempting to execute
+        route : CommandRoute
+            The route of `command` already resolved with _route()
+            (None resolves it here)
+
+        Returns : str
+            The accompanying error message(None assumes valid). A
+            constant code such as NOT_ALLOWED_NOW if the game's 
+            EngineProfile has format_messages off
 
-        Returns : bool
+        Notes
+        -----
+        Subclasses document the commands of their phase and 
+        delegate to this method.
+        """
+        if route is None:
+            route = self._route(command)
+        if route is None:
+            return self._not_allowed(command)
+        return route.validator(self, command)
+
+    def _not_allowed(self, command: Command) -> str:
+        """
+        Returns the error of a command with no route in the 
+        current sub-state
         """
-        if type(command) in self.whitelisted_commands:
-            return True
-        
-        else:
-            return False
+        if not self.game.profile.format_messages:
+            return NOT_ALLOWED_NOW
+        return f"{type(command).__name__} cannot be executed now"
     
\ No newline at end of file